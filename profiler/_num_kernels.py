@@ -0,0 +1,40 @@
+"""Numba-compiled numeric kernels shared by the robust profilers.
+
+numba is optional: importers must check the kernels for None and keep a
+pandas/numpy fallback path.
+"""
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def fused_stats(arr):
+        """Single pass over a float64 array producing
+        (sum, sum_sq, min, max, zero_count, neg_count, pos_count)."""
+        total = 0.0
+        total_sq = 0.0
+        mn = arr[0]
+        mx = arr[0]
+        zero = 0
+        neg = 0
+        pos = 0
+        for i in range(arr.size):
+            x = arr[i]
+            total += x
+            total_sq += x * x
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+            if x == 0.0:
+                zero += 1
+            elif x < 0.0:
+                neg += 1
+            else:
+                pos += 1
+        return total, total_sq, mn, mx, zero, neg, pos
+else:
+    fused_stats = None
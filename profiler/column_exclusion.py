@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 import re
 import base64
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Union, Set, Tuple
 import statistics
 import logging
@@ -9,6 +11,34 @@ import logging
 logger = logging.getLogger("dataset_profiler")
 
 
+def _profile_column_group(profiler: "RobustDatasetProfiler",
+                          df_group: pd.DataFrame,
+                          kwargs: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+    """
+    Worker function for process-pool profiling of a column-disjoint sub-frame.
+
+    Runs both the exclusion analysis and the column profiling for the subset,
+    so a single worker dispatch covers both phases. Must be a module-level
+    function so it can be pickled for ProcessPoolExecutor.
+    """
+    column_analysis = profiler.analyze_dataframe_columns(df_group)
+
+    excluded_columns = [col for col, analysis in column_analysis.items()
+                        if analysis.get("exclude", False)]
+    included_columns = [col for col in df_group.columns if col not in excluded_columns]
+    text_summary_columns = [
+        col for col, analysis in column_analysis.items()
+        if analysis.get("content_type") in ["long_text", "free_text"]
+        and not analysis.get("exclude", False)
+        and profiler.config.text_summarization_only
+    ]
+
+    profile_results = profiler._profile_columns(
+        df_group, included_columns, text_summary_columns, **kwargs
+    )
+    return column_analysis, profile_results
+
+
 class ColumnExclusionHeuristics:
     """
     Provides heuristics to determine which columns should be excluded from detailed profiling.
@@ -80,14 +110,23 @@ class ColumnExclusionHeuristics:
         if series.empty or series.isna().all():
             return result
         
-        # Get sample of non-null values
-        valid_values = series.dropna()
-        sample = valid_values.sample(min(sample_size, len(valid_values))) if len(valid_values) > sample_size else valid_values
-        
         # Check data type
         dtype_name = str(series.dtype)
         result["metrics"]["dtype"] = dtype_name
-        
+
+        # Fast path: datetime, timedelta, bool and categorical columns trigger
+        # none of the heuristics below, so record lightweight metrics and skip
+        # sampling and the deep memory scan entirely.
+        if series.dtype.kind in "Mmb" or isinstance(series.dtype, pd.CategoricalDtype):
+            valid_count = series.count()
+            result["metrics"]["unique_ratio"] = series.nunique() / valid_count if valid_count > 0 else 0
+            result["metrics"]["memory_usage_mb"] = series.memory_usage(deep=False) / (1024 * 1024)
+            return result
+
+        # Get sample of non-null values
+        valid_values = series.dropna()
+        sample = valid_values.sample(min(sample_size, len(valid_values))) if len(valid_values) > sample_size else valid_values
+
         # Different analysis based on data type
         if pd.api.types.is_numeric_dtype(series):
             # For numeric columns, check if it might be a unique identifier
@@ -100,8 +139,13 @@ class ColumnExclusionHeuristics:
                 result["content_type"] = "numeric_id"
         
         elif pd.api.types.is_string_dtype(series) or pd.api.types.is_object_dtype(series):
-            # Convert to string for analysis, handling non-string objects
-            string_sample = sample.astype(str)
+            # Convert to string for analysis, handling non-string objects.
+            # Already-string columns can be used as-is, skipping an O(sample)
+            # Series rebuild.
+            if pd.api.types.is_string_dtype(sample):
+                string_sample = sample
+            else:
+                string_sample = sample.astype(str)
             
             # Calculate string lengths
             string_lengths = string_sample.str.len()
@@ -195,74 +239,93 @@ class ColumnExclusionHeuristics:
         non_empty = string_sample[string_sample.str.len() > 4]
         if len(non_empty) == 0:
             return results
-        
+
+        # Pattern matching is per-element; build the match masks with
+        # np.fromiter into preallocated bool arrays rather than going through
+        # Series.apply's per-element __setitem__ path.
+        values = non_empty.to_numpy()
+        n_values = len(values)
+
+        def match_mask(pattern):
+            return np.fromiter(
+                (pattern.match(str(v)) is not None for v in values),
+                dtype=bool, count=n_values
+            )
+
         # Check for base64 encoded content
-        base64_matches = non_empty.apply(lambda x: bool(self.base64_pattern.match(str(x))))
-        base64_ratio = base64_matches.mean() if not base64_matches.empty else 0
+        base64_matches = match_mask(self.base64_pattern)
+        base64_ratio = base64_matches.mean() if n_values > 0 else 0
         results["base64_ratio"] = base64_ratio
         results["likely_base64"] = base64_ratio > self.base64_detection_threshold
-        
+
         # Try to decode a few samples as base64 if likely
         if results["likely_base64"]:
             try:
-                # Sample a few values and see if they decode properly
-                sample_values = non_empty[base64_matches].sample(min(5, len(non_empty[base64_matches])))
-                successful_decodes = 0
-                
-                for value in sample_values:
+                # Probe a few matching values and see if they decode properly.
+                # Ordering doesn't matter for a validity probe, so the first
+                # few suffice.
+                sample_values = values[base64_matches][:5]
+
+                def decodes(value):
                     try:
                         # Add padding if needed
-                        padded_value = value + '=' * (4 - len(value) % 4)
-                        decoded = base64.b64decode(padded_value)
-                        # If we're here, it decoded successfully
-                        successful_decodes += 1
+                        base64.b64decode(value + '=' * (4 - len(value) % 4))
+                        return True
                     except:
-                        pass
-                
+                        return False
+
+                successful_decodes = np.fromiter(
+                    (decodes(v) for v in sample_values),
+                    dtype=bool, count=len(sample_values)
+                ).sum()
+
                 # If none decoded successfully, it's probably not base64 despite matching pattern
                 if successful_decodes == 0:
                     results["likely_base64"] = False
             except Exception as e:
                 logger.debug(f"Error in base64 decode test: {str(e)}")
-        
+
         # Check for hexadecimal content
-        hex_matches = non_empty.apply(lambda x: bool(self.hex_pattern.match(str(x))))
-        hex_ratio = hex_matches.mean() if not hex_matches.empty else 0
+        hex_ratio = match_mask(self.hex_pattern).mean() if n_values > 0 else 0
         results["hex_ratio"] = hex_ratio
         results["likely_hex"] = hex_ratio > self.hex_detection_threshold
-        
+
         # Check for UUID strings
-        uuid_matches = non_empty.apply(lambda x: bool(self.uuid_pattern.match(str(x))))
-        uuid_ratio = uuid_matches.mean() if not uuid_matches.empty else 0
+        uuid_ratio = match_mask(self.uuid_pattern).mean() if n_values > 0 else 0
         results["uuid_ratio"] = uuid_ratio
         results["likely_uuid"] = uuid_ratio > self.uuid_detection_threshold
-        
+
         # Check for JSON content
-        json_matches = non_empty.apply(lambda x: bool(self.json_pattern.match(str(x))))
-        json_ratio = json_matches.mean() if not json_matches.empty else 0
+        json_matches = match_mask(self.json_pattern)
+        json_ratio = json_matches.mean() if n_values > 0 else 0
         results["json_ratio"] = json_ratio
         results["likely_json"] = json_ratio > self.json_detection_threshold
-        
+
         # If likely JSON, perform additional validation
         if results["likely_json"]:
             try:
-                # Sample a few values and see if they parse as JSON
-                sample_values = non_empty[json_matches].sample(min(5, len(non_empty[json_matches])))
-                successful_parses = 0
-                
+                # Probe a few matching values and see if they parse as JSON
+                sample_values = values[json_matches][:5]
+
                 import json
-                for value in sample_values:
+
+                def parses(value):
                     try:
                         json.loads(value)
-                        successful_parses += 1
+                        return True
                     except:
-                        pass
-                
+                        return False
+
+                successful_parses = np.fromiter(
+                    (parses(v) for v in sample_values),
+                    dtype=bool, count=len(sample_values)
+                ).sum()
+
                 # Update likelihood based on parsing success
                 results["likely_json"] = successful_parses > 0
             except Exception as e:
                 logger.debug(f"Error in JSON validation: {str(e)}")
-        
+
         return results
 
 
@@ -395,17 +458,32 @@ class RobustDatasetProfiler:
         
         return results
 
-    def profile_dataframe(self, df: pd.DataFrame, **kwargs) -> Dict[str, Any]:
+    def profile_dataframe(self, df: pd.DataFrame, parallel: bool = True, **kwargs) -> Dict[str, Any]:
         """
         Profile a DataFrame with automatic column exclusion.
-        
+
+        Column profiling is column-separable: each column's analysis and profile
+        only reads that column. When more than one CPU is available the columns
+        are split into disjoint groups and dispatched to a process pool, with
+        results combined by dict-merge.
+
         Args:
             df: The DataFrame to profile
+            parallel: Whether to use process-pool parallelism for multi-column frames
             **kwargs: Additional profiling parameters
-            
+
         Returns:
             Dictionary with profiling results
         """
+        max_workers = min(os.cpu_count() or 1, len(df.columns))
+        if parallel and max_workers > 1:
+            try:
+                return self._profile_dataframe_parallel(df, max_workers, **kwargs)
+            except Exception as e:
+                self.logger.warning(
+                    f"Parallel profiling failed, falling back to sequential: {str(e)}"
+                )
+
         # First, analyze columns for exclusion
         column_analysis = self.analyze_dataframe_columns(df)
         
@@ -445,10 +523,64 @@ class RobustDatasetProfiler:
         
         # Add exclusion information to the profile
         profile_results["column_exclusion_info"] = exclusion_summary
-        
+
         return profile_results
-    
-    def _profile_columns(self, df: pd.DataFrame, 
+
+    def _profile_dataframe_parallel(self, df: pd.DataFrame, max_workers: int, **kwargs) -> Dict[str, Any]:
+        """
+        Profile a DataFrame by splitting its columns into disjoint groups and
+        running both analysis and profiling for each group in a worker process.
+
+        A single pool is shared across both phases (each worker runs analysis
+        and profiling for its group) to avoid paying the fork cost twice.
+        """
+        column_groups = [list(group) for group in np.array_split(np.asarray(df.columns, dtype=object), max_workers)]
+        column_groups = [group for group in column_groups if group]
+
+        column_analysis: Dict[str, Dict[str, Any]] = {}
+        column_profiles: Dict[str, Any] = {}
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_profile_column_group, self, df[group], kwargs)
+                for group in column_groups
+            ]
+            for future in futures:
+                group_analysis, group_profile = future.result()
+                # Combine with plain dict-merge: groups are column-disjoint
+                column_analysis.update(group_analysis)
+                column_profiles.update(group_profile.get("column_profiles", {}))
+
+        excluded_columns = [col for col in df.columns
+                            if column_analysis.get(col, {}).get("exclude", False)]
+        included_columns = [col for col in df.columns if col not in excluded_columns]
+
+        exclusion_summary = {
+            "excluded_column_count": len(excluded_columns),
+            "excluded_columns": excluded_columns,
+            "excluded_column_details": {
+                col: {
+                    "content_type": column_analysis[col].get("content_type", "unknown"),
+                    "reasons": column_analysis[col].get("reasons", []),
+                    "metrics": column_analysis[col].get("metrics", {})
+                }
+                for col in excluded_columns
+            },
+            "included_column_count": len(included_columns),
+            "included_columns": included_columns
+        }
+
+        return {
+            "dataset_info": {
+                "row_count": len(df),
+                "column_count": len(df.columns),
+                "profiled_column_count": len(included_columns)
+            },
+            "column_profiles": column_profiles,
+            "column_exclusion_info": exclusion_summary
+        }
+
+    def _profile_columns(self, df: pd.DataFrame,
                         included_columns: List[str], 
                         text_summary_columns: List[str],
                         **kwargs) -> Dict[str, Any]:
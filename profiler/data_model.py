@@ -1,9 +1,33 @@
+import bisect
+import heapq
+from collections import Counter
+
+import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 from enum import Enum
 import json
 
+# Optional: orjson serializes large profile dicts (floats, datetimes, numpy
+# scalars) natively in C; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """Unwrap values orjson doesn't serialize natively (Enums, object-dtype
+    numpy arrays)."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class DataType(Enum):
     """Enum representing inferred data types."""
@@ -20,7 +44,17 @@ class DataType(Enum):
     NULL = "null"
 
 
-@dataclass
+# Enum .value goes through a descriptor on every access; hot loops over many
+# columns look the string up here instead. Lookups fall back to .value so
+# profiles built with the inferer module's own DataType enum still serialize
+_TYPE_STR = {t: t.value for t in DataType}
+
+
+def _type_str(t: Enum) -> str:
+    return _TYPE_STR.get(t) or t.value
+
+
+@dataclass(slots=True)
 class ColumnProfile:
     """Profile for a single column in the dataset."""
     name: str
@@ -38,9 +72,12 @@ class ColumnProfile:
     median: Optional[float] = None
     std_dev: Optional[float] = None
     
-    # Distribution information
-    frequent_values: Dict[Any, int] = field(default_factory=dict)
-    histogram_bins: Optional[List[Tuple[Any, int]]] = None
+    # Distribution information, stored as parallel (values, counts) arrays —
+    # two contiguous buffers instead of a per-entry Python dict
+    frequent_values_arr: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    # Histogram as (edges, counts) arrays — two contiguous buffers rather
+    # than a list of per-bin tuples
+    histogram: Optional[Tuple[np.ndarray, np.ndarray]] = None
     
     # Quality metrics
     has_duplicates: bool = False
@@ -53,6 +90,24 @@ class ColumnProfile:
     # Pattern detection
     detected_patterns: Optional[Dict[str, int]] = None
     
+    @property
+    def frequent_values(self) -> Dict[Any, int]:
+        """Per-value counts as a dict, zipped from the arrays on demand."""
+        if self.frequent_values_arr is None:
+            return {}
+        values, counts = self.frequent_values_arr
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    def set_frequent_values(self, series, top_k: int = 10) -> None:
+        """Record the top_k most frequent values via hashed value_counts."""
+        vc = series.value_counts().head(top_k)
+        self.frequent_values_arr = (vc.index.to_numpy(), vc.to_numpy())
+
+    def set_histogram(self, values, bins: int = 10) -> None:
+        """Bin numeric values into (edges, counts) arrays via np.histogram."""
+        counts, edges = np.histogram(values, bins=bins)
+        self.histogram = (edges, counts)
+
     def compute_missing_percentage(self) -> float:
         """Calculate percentage of missing values."""
         if self.count == 0:
@@ -63,7 +118,7 @@ class ColumnProfile:
         """Convert profile to dictionary format."""
         result = {
             "name": self.name,
-            "inferred_type": self.inferred_type.value,
+            "inferred_type": _type_str(self.inferred_type),
             "count": self.count,
             "missing_count": self.missing_count,
             "missing_percentage": self.compute_missing_percentage(),
@@ -77,8 +132,13 @@ class ColumnProfile:
             if getattr(self, attr) is not None:
                 result[attr] = getattr(self, attr)
                 
-        if self.frequent_values:
+        if self.frequent_values_arr is not None:
             result["frequent_values"] = self.frequent_values
+
+        if self.histogram is not None:
+            edges, counts = self.histogram
+            result["histogram"] = {"edges": edges.tolist(),
+                                   "counts": counts.tolist()}
             
         if self.min_length is not None:
             result["min_length"] = self.min_length
@@ -101,14 +161,21 @@ class DatasetProfile:
         self.dataset_name = dataset_name or self._extract_name_from_path(dataset_path)
         self.file_format = file_format
         self.profile_timestamp = datetime.now()
+        # Free-form metadata populated by loaders (CsvProfile, JsonProfile)
+        self.metadata: Dict[str, Any] = {}
         
-        # Dataset metrics
-        self.row_count = 0
-        self.column_count = 0
+        # Dataset metrics (totals cached by the property setters below)
+        self._row_count = 0
+        self._column_count = 0
+        self._total_cells = 0
+        self._pct_per_cell = 0.0
         self.total_size_bytes = 0
         
         # Column-level profiles
         self.column_profiles: Dict[str, ColumnProfile] = {}
+        # Incremental indexes so type/missing queries need no linear scan
+        self._by_type: Dict[DataType, List[str]] = {}
+        self._missing_pct: List[Tuple[float, str]] = []  # sorted by pct
         
         # Quality metrics
         self.missing_cells_count = 0
@@ -126,44 +193,73 @@ class DatasetProfile:
         """Extract dataset name from file path."""
         import os
         return os.path.basename(path)
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @row_count.setter
+    def row_count(self, value: int) -> None:
+        self._row_count = value
+        self._refresh_total_cells()
+
+    @property
+    def column_count(self) -> int:
+        return self._column_count
+
+    @column_count.setter
+    def column_count(self, value: int) -> None:
+        self._column_count = value
+        self._refresh_total_cells()
+
+    def _refresh_total_cells(self) -> None:
+        """Cache row*column and the per-cell percentage factor so the metric
+        methods below are branch-light multiplications."""
+        self._total_cells = self._row_count * self._column_count
+        self._pct_per_cell = 100.0 / self._total_cells if self._total_cells else 0.0
     
     def add_column_profile(self, column_name: str, profile: ColumnProfile) -> None:
         """Add or update a column profile."""
+        previous = self.column_profiles.get(column_name)
+        if previous is not None:
+            # Drop stale index entries before re-adding
+            self._by_type[previous.inferred_type].remove(column_name)
+            self._missing_pct = [(pct, name) for pct, name in self._missing_pct
+                                 if name != column_name]
         self.column_profiles[column_name] = profile
+        self._by_type.setdefault(profile.inferred_type, []).append(column_name)
+        bisect.insort(self._missing_pct,
+                      (profile.compute_missing_percentage(), column_name))
         # Update dataset-wide stats based on column
         self.missing_cells_count += profile.missing_count
     
     def compute_missing_cells_percentage(self) -> float:
         """Calculate percentage of missing values across the entire dataset."""
-        total_cells = self.row_count * self.column_count
-        if total_cells == 0:
-            return 0.0
-        return (self.missing_cells_count / total_cells) * 100
+        return self.missing_cells_count * self._pct_per_cell
     
     def get_column_types(self) -> Dict[str, str]:
         """Get map of column names to their inferred types."""
-        return {name: profile.inferred_type.value 
+        return {name: _type_str(profile.inferred_type)
                 for name, profile in self.column_profiles.items()}
     
     def get_completeness_score(self) -> float:
         """Calculate overall completeness score (0-100%)."""
-        total_cells = self.row_count * self.column_count
-        if total_cells == 0:
+        if not self._total_cells:
             return 100.0
-        return 100 - self.compute_missing_cells_percentage()
+        return 100 - self.missing_cells_count * self._pct_per_cell
     
     def get_columns_by_type(self, data_type: DataType) -> List[str]:
         """Get list of columns that match the specified type."""
-        return [name for name, profile in self.column_profiles.items() 
-                if profile.inferred_type == data_type]
-    
+        return list(self._by_type.get(data_type, []))
+
     def get_problematic_columns(self, missing_threshold: float = 50.0) -> List[str]:
         """Get columns with high percentage of missing values."""
-        return [name for name, profile in self.column_profiles.items() 
-                if profile.compute_missing_percentage() > missing_threshold]
+        start = bisect.bisect_right(self._missing_pct, missing_threshold,
+                                    key=lambda entry: entry[0])
+        return [name for _, name in self._missing_pct[start:]]
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the entire profile to a dictionary."""
+    def _meta_dict(self) -> Dict[str, Any]:
+        """Dataset-level sections of the profile (everything but columns)."""
         return {
             "dataset_metadata": {
                 "name": self.dataset_name,
@@ -172,6 +268,7 @@ class DatasetProfile:
                 "profile_timestamp": self.profile_timestamp.isoformat(),
                 "total_size_bytes": self.total_size_bytes
             },
+            "metadata": self.metadata,
             "dataset_stats": {
                 "row_count": self.row_count,
                 "column_count": self.column_count,
@@ -180,21 +277,55 @@ class DatasetProfile:
                 "duplicate_rows_count": self.duplicate_rows_count,
                 "completeness_score": self.get_completeness_score()
             },
-            "column_profiles": {
-                name: profile.to_dict() for name, profile in self.column_profiles.items()
-            },
             "processing_info": {
                 "processing_time_ms": self.processing_time_ms,
                 "errors": self.profiling_errors,
                 "warnings": self.warnings
             }
         }
-    
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the entire profile to a dictionary."""
+        result = self._meta_dict()
+        result["column_profiles"] = {
+            name: profile.to_dict() for name, profile in self.column_profiles.items()
+        }
+        return result
+
     def to_json(self, indent: int = 2) -> str:
-        """Convert the profile to JSON format."""
+        """Convert the profile to JSON format.
+
+        With orjson the ColumnProfile dataclasses are serialized natively in
+        C (no per-column to_dict pass); their raw fields are emitted and None
+        fields appear as null. The stdlib fallback keeps the pruned to_dict
+        layout.
+        """
+        if orjson is not None:
+            payload = self._meta_dict()
+            payload["column_profiles"] = self.column_profiles
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=_json_default,
+            ).decode()
         return json.dumps(self.to_dict(), indent=indent)
     
-    def get_summary(self) -> str:
+    def get_summary(self) -> Dict[str, Any]:
+        """Summary of headline dataset stats.
+
+        Keeps the dict contract of the old dataset_profile.DatasetProfile
+        this class absorbed — the rule engine and report renderers iterate
+        these keys. See get_summary_text() for the formatted report.
+        """
+        return {
+            "dataset_name": self.dataset_name,
+            "row_count": self.row_count,
+            "column_count": self.column_count or len(self.column_profiles),
+            "profile_timestamp": self.profile_timestamp.isoformat(),
+            "columns": list(self.column_profiles.keys()),
+        }
+
+    def get_summary_text(self) -> str:
         """Get a textual summary of the dataset profile."""
         summary = []
         summary.append(f"Dataset: {self.dataset_name} ({self.file_format})")
@@ -203,22 +334,20 @@ class DatasetProfile:
         
         if self.column_count > 0:
             summary.append("\nColumn Type Summary:")
-            type_counts = {}
-            for profile in self.column_profiles.values():
-                type_name = profile.inferred_type.value
-                type_counts[type_name] = type_counts.get(type_name, 0) + 1
-                
+            type_counts = Counter(_type_str(p.inferred_type)
+                                  for p in self.column_profiles.values())
+
             for type_name, count in type_counts.items():
                 summary.append(f"  {type_name}: {count} columns")
-            
+
             if self.missing_cells_count > 0:
                 summary.append("\nColumns with highest missing values:")
-                problematic = [(name, profile.compute_missing_percentage()) 
-                              for name, profile in self.column_profiles.items()
-                              if profile.missing_count > 0]
-                problematic.sort(key=lambda x: x[1], reverse=True)
-                
-                for name, pct in problematic[:5]:  # Top 5 problematic columns
+                pct_map = {name: (p.missing_count / p.count * 100) if p.count else 0.0
+                           for name, p in self.column_profiles.items()
+                           if p.missing_count > 0}
+                # Top 5 problematic columns: nlargest is O(n) vs a full sort
+                for name, pct in heapq.nlargest(5, pct_map.items(),
+                                                key=lambda kv: kv[1]):
                     summary.append(f"  {name}: {pct:.2f}% missing")
         
         return "\n".join(summary)
\ No newline at end of file
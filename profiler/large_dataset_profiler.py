@@ -1,3 +1,14 @@
+import os
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Bytes of the file head used to estimate the average line length
+_ESTIMATE_SAMPLE_BYTES = 1 << 20
+
+
 class LargeDatasetProfiler:
     """Profiler optimized for large datasets (>10K rows)."""
     
@@ -32,9 +43,47 @@ class LargeDatasetProfiler:
         return self._execute_profiling_plan(data_source, profiling_plan)
         
     def _estimate_row_count(self, data_source):
-        """Efficiently estimate row count without loading entire dataset."""
-        # Implementation depends on data source type
-        pass
+        """Efficiently estimate row count without loading entire dataset.
+
+        For line-oriented files (CSV, JSON lines) the estimate comes from the
+        average line length over the first megabyte — O(1) in file size. For
+        Parquet the exact count is an O(1) footer read. In-memory frames are
+        counted directly.
+        """
+        if not isinstance(data_source, (str, os.PathLike)):
+            if hasattr(data_source, "__len__"):
+                return len(data_source)
+            return 0
+
+        path = os.fspath(data_source)
+        if not os.path.exists(path):
+            return 0
+
+        if path.endswith(".parquet") and pq is not None:
+            return pq.ParquetFile(path).metadata.num_rows
+
+        file_size = os.path.getsize(path)
+        if file_size == 0:
+            return 0
+
+        with open(path, "rb") as f:
+            chunk = f.read(_ESTIMATE_SAMPLE_BYTES)
+
+        newlines = chunk.count(b"\n")
+        if newlines == 0:
+            return 1
+
+        if len(chunk) == file_size:
+            # Whole file fits in the sample: the newline count is exact
+            row_count = newlines if chunk.endswith(b"\n") else newlines + 1
+        else:
+            avg_line = len(chunk) / newlines
+            row_count = int(file_size / avg_line)
+
+        # Discount the header line for CSV files
+        if path.endswith(".csv"):
+            row_count -= 1
+        return max(row_count, 0)
         
     def _create_profiling_plan(self, data_source, total_rows):
         """Create an optimized profiling execution plan."""
@@ -61,5 +110,28 @@ class LargeDatasetProfiler:
         
     def _execute_profiling_plan(self, data_source, plan):
         """Execute the profiling plan with optimizations."""
-        # Apply different techniques based on plan
-        pass
\ No newline at end of file
+        import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .numeric_profile_optimized import profile_numeric_column_optimized
+
+        if isinstance(data_source, pd.DataFrame):
+            df = data_source
+        else:
+            from .basic_profiler import load_data
+            df = load_data(os.fspath(data_source))
+
+        total_rows = len(df)
+        numeric_columns = df.select_dtypes(include=['number']).columns.tolist()
+
+        results = {"plan": plan, "row_count": total_rows, "columns": {}}
+        if numeric_columns:
+            # Column profiles are independent and numpy-bound (GIL released),
+            # so a thread pool gives near-linear scaling across cores
+            max_workers = min(os.cpu_count() or 1, len(numeric_columns))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                profiles = executor.map(
+                    lambda col: profile_numeric_column_optimized(df, col, total_rows),
+                    numeric_columns)
+            results["columns"] = dict(zip(numeric_columns, profiles))
+        return results
\ No newline at end of file
@@ -2,6 +2,75 @@ import numpy as np
 import pandas as pd
 from typing import Dict
 
+# Optional: numba compiles the single-pass stats + reservoir kernel to
+# machine code; without it the pandas/numpy fallbacks below are used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _running_and_reservoir(arr, k, seed):
+        """One sweep over a float64 buffer: Welford running stats plus an
+        Algorithm R reservoir sample, skipping NaNs."""
+        np.random.seed(seed)
+        reservoir = np.empty(k, dtype=np.float64)
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        mn = np.inf
+        mx = -np.inf
+        for i in range(arr.size):
+            x = arr[i]
+            if x != x:  # NaN
+                continue
+            n += 1
+            d = x - mean
+            mean += d / n
+            m2 += d * (x - mean)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+            if n <= k:
+                reservoir[n - 1] = x
+            else:
+                j = np.random.randint(0, n)
+                if j < k:
+                    reservoir[j] = x
+        filled = n if n < k else k
+        return n, mean, m2, mn, mx, reservoir[:filled]
+
+    @njit(cache=True, fastmath=True)
+    def welford_update(arr, n0, mean0, m2_0, mn, mx):
+        """Fold one chunk into a running (count, mean, M2, min, max) state
+        using Welford's numerically stable update, skipping NaNs."""
+        n = n0
+        mean = mean0
+        m2 = m2_0
+        for i in range(arr.size):
+            x = arr[i]
+            if x != x:  # NaN
+                continue
+            n += 1
+            d = x - mean
+            mean += d / n
+            m2 += d * (x - mean)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+        return n, mean, m2, mn, mx
+else:
+    _running_and_reservoir = None
+    welford_update = None
+
+# Rows folded into the running state per kernel call
+_WELFORD_CHUNK_ROWS = 1 << 18
+
+
 def calculate_running_stats(df: pd.DataFrame, column: str) -> Dict[str, float]:
     """Calculates count, mean, std, min, and max using pandas."""
     series = df[column].dropna()
@@ -18,7 +87,12 @@ def reservoir_sample(df: pd.DataFrame, column: str, sample_size: int = 10000) ->
     series = df[column].dropna()
     if len(series) <= sample_size:
         return series
-    return series.sample(n=sample_size, random_state=42)
+    # PCG64 index sampling plus fancy indexing on the raw buffer is several
+    # times faster than Series.sample (no label alignment, no Mersenne RNG)
+    arr = series.to_numpy(copy=False)
+    rng = np.random.default_rng(42)
+    idx = rng.choice(arr.shape[0], size=sample_size, replace=False)
+    return pd.Series(arr[idx], name=series.name)
 
 def calculate_quantiles(sample: pd.Series) -> Dict[float, float]:
     """Calculates median, Q1, and Q3 from the sample."""
@@ -29,8 +103,31 @@ def calculate_quantiles(sample: pd.Series) -> Dict[float, float]:
     }
 
 def profile_numeric_column_exact_chunked(df: pd.DataFrame, column: str) -> Dict[str, float]:
-    """Placeholder: assumes exact chunk-based profiling logic is defined elsewhere."""
-    # You should replace this with your actual chunking logic or call from another file.
+    """Exact profiling via chunked running statistics."""
+    if welford_update is not None:
+        arr = pd.to_numeric(df[column], errors='coerce').to_numpy(
+            dtype=np.float64, copy=False)
+        n, mean, m2 = 0, 0.0, 0.0
+        mn, mx = np.inf, -np.inf
+        for start in range(0, arr.size, _WELFORD_CHUNK_ROWS):
+            n, mean, m2, mn, mx = welford_update(
+                arr[start:start + _WELFORD_CHUNK_ROWS], n, mean, m2, mn, mx)
+        valid = arr[~np.isnan(arr)]
+        q1, median, q3 = (np.quantile(valid, [0.25, 0.5, 0.75])
+                          if n else (float('nan'),) * 3)
+        return {
+            "count": int(n),
+            "mean": float(mean) if n else float('nan'),
+            "std": float(np.sqrt(m2 / (n - 1))) if n > 1 else float('nan'),
+            "min": float(mn) if n else float('nan'),
+            "max": float(mx) if n else float('nan'),
+            "median": float(median),
+            "q1": float(q1),
+            "q3": float(q3),
+            "distribution": "exact",
+            "sample_size": int(n)
+        }
+
     series = df[column].dropna()
     return {
         "count": int(series.count()),
@@ -50,12 +147,33 @@ def profile_numeric_column_optimized(df: pd.DataFrame, column: str, total_rows:
     
     if total_rows < 100000:
         return profile_numeric_column_exact_chunked(df, column)
-    
+
+    if _running_and_reservoir is not None:
+        # Single JIT-compiled pass: running stats and reservoir sample in one
+        # sweep over the raw buffer instead of three pandas scans
+        arr = pd.to_numeric(df[column], errors='coerce').to_numpy(
+            dtype=np.float64, copy=False)
+        n, mean, m2, mn, mx, reservoir = _running_and_reservoir(arr, 10000, 42)
+        std = float(np.sqrt(m2 / (n - 1))) if n > 1 else float('nan')
+        q1, median, q3 = np.quantile(reservoir, [0.25, 0.5, 0.75])
+        return {
+            "count": int(n),
+            "mean": float(mean),
+            "std": std,
+            "min": float(mn),
+            "max": float(mx),
+            "median": float(median),
+            "q1": float(q1),
+            "q3": float(q3),
+            "distribution": "approximate",
+            "sample_size": len(reservoir)
+        }
+
     # Use hybrid approximate profiling for large datasets
     running_stats = calculate_running_stats(df, column)
     sample = reservoir_sample(df, column, 10000)
     quantiles = calculate_quantiles(sample)
-    
+
     return {
         "count": running_stats["count"],
         "mean": running_stats["mean"],
@@ -1,10 +1,14 @@
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Union, Any, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class NumericColumnStats:
     """Typed model for numeric column statistics."""
     column_name: str
@@ -63,17 +67,27 @@ class NumericProfiler:
         Returns:
             Dictionary or NumericColumnStats object with numeric statistics
         """
-        # Filter out non-numeric values if any
-        numeric_series = pd.to_numeric(series, errors='coerce')
-        
+        # Filter out non-numeric values if any; already-numeric dtypes (the
+        # common case via profile_dataframe's select_dtypes) skip the
+        # element-wise coercion pass entirely
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            numeric_series = series
+        else:
+            numeric_series = pd.to_numeric(series, errors='coerce')
+
+        # Work on the raw float64 buffer: every reduction below then runs on a
+        # contiguous ndarray instead of re-dispatching through a Series
+        arr = numeric_series.to_numpy(dtype=np.float64, copy=False)
+
         # Basic counts
         count = len(series)
-        null_count = numeric_series.isna().sum()
+        nan_mask = np.isnan(arr)
+        null_count = int(nan_mask.sum())
         null_percent = (null_count / count * 100) if count > 0 else 0
-        
+
         # Filter out nulls for further calculations
-        valid_values = numeric_series.dropna()
-        
+        valid_values = arr[~nan_mask]
+
         # If no valid values after filtering, return with defaults
         if len(valid_values) == 0:
             result = {
@@ -94,14 +108,16 @@ class NumericProfiler:
             }
             return NumericColumnStats.from_dict(result) if use_typed_model else result
         
-        # Calculate statistics
+        # Calculate statistics (ddof=1 matches pandas Series.std)
         mean_val = valid_values.mean()
         min_val = valid_values.min()
         max_val = valid_values.max()
-        stddev_val = valid_values.std()
-        
-        # Calculate percentiles
-        p10, q1, median, q3, p90 = valid_values.quantile([0.1, 0.25, 0.5, 0.75, 0.9]).values
+        stddev_val = valid_values.std(ddof=1)
+
+        # Calculate all five percentiles in one call: numpy partitions the
+        # array once on the required order statistics (linear-time selection)
+        # instead of fully sorting per quantile
+        p10, q1, median, q3, p90 = np.quantile(valid_values, [0.1, 0.25, 0.5, 0.75, 0.9])
         iqr = q3 - q1
         
         # Create result dictionary
@@ -143,12 +159,86 @@ class NumericProfiler:
         # Auto-detect numeric columns if not specified
         if numeric_columns is None:
             numeric_columns = df.select_dtypes(include=['number']).columns.tolist()
-        
+
+        present = [col for col in numeric_columns if col in df.columns]
+
+        # When every requested column is already numeric, profile the whole
+        # 2-D float block at once: one batched numpy reduction per statistic
+        # instead of re-entering pandas per column
+        if present and all(pd.api.types.is_numeric_dtype(df[col]) for col in present):
+            return NumericProfiler._profile_block(df, present, use_typed_model)
+
+        if len(present) <= 1:
+            return {col: NumericProfiler.profile_series(df[col], use_typed_model)
+                    for col in present}
+
+        # Mixed dtypes: profile columns concurrently — to_numeric and the
+        # numpy reductions release the GIL, so threads scale across cores
+        max_workers = min(os.cpu_count() or 1, len(present))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            profiles = executor.map(
+                lambda col: NumericProfiler.profile_series(df[col], use_typed_model),
+                present)
+        return dict(zip(present, profiles))
+
+    @staticmethod
+    def _profile_block(df: pd.DataFrame,
+                       columns: List[str],
+                       use_typed_model: bool = False) -> Dict[str, Union[Dict[str, Any], NumericColumnStats]]:
+        """Profile a set of numeric columns via column-wise reductions over a
+        single float64 block."""
+        block = df[columns].to_numpy(dtype=np.float64)
+        n = block.shape[0]
+        counts = (~np.isnan(block)).sum(axis=0)
+
+        stats = {}
+        valid_pos = np.flatnonzero(counts)
+        if valid_pos.size:
+            sub = block[:, valid_pos]
+            with warnings.catch_warnings():
+                # single-valued columns yield NaN std (ddof=1), like pandas
+                warnings.simplefilter("ignore", RuntimeWarning)
+                means = np.nanmean(sub, axis=0)
+                stds = np.nanstd(sub, axis=0, ddof=1)
+                mins = np.nanmin(sub, axis=0)
+                maxs = np.nanmax(sub, axis=0)
+                quants = np.nanquantile(sub, [0.1, 0.25, 0.5, 0.75, 0.9], axis=0)
+            stats = {
+                int(pos): (means[j], stds[j], mins[j], maxs[j], quants[:, j])
+                for j, pos in enumerate(valid_pos)
+            }
+
         results = {}
-        for col in numeric_columns:
-            if col in df.columns:
-                results[col] = NumericProfiler.profile_series(df[col], use_typed_model)
-            
+        for j, col in enumerate(columns):
+            null_count = int(n - counts[j])
+            result = {
+                "column_name": col,
+                "count": n,
+                "null_count": null_count,
+                "null_percent": (null_count / n * 100) if n > 0 else 0,
+            }
+            if j in stats:
+                mean_val, stddev_val, min_val, max_val, (p10, q1, median, q3, p90) = stats[j]
+                result.update({
+                    "mean": mean_val,
+                    "min": min_val,
+                    "max": max_val,
+                    "stddev": stddev_val,
+                    "median": median,
+                    "q1": q1,
+                    "q3": q3,
+                    "iqr": q3 - q1,
+                    "p10": p10,
+                    "p90": p90,
+                })
+            else:
+                result.update({
+                    "mean": None, "min": None, "max": None, "stddev": None,
+                    "median": None, "q1": None, "q3": None, "iqr": None,
+                    "p10": None, "p90": None,
+                })
+            results[col] = NumericColumnStats.from_dict(result) if use_typed_model else result
+
         return results
 
 
@@ -2,13 +2,31 @@ import pandas as pd
 from .dataset_profile import DatasetProfile  # Adjust import path if needed
 from datetime import datetime
 
+# Optional: pyarrow's CSV reader parses multi-threaded in C++; pd.read_csv
+# remains the fallback when pyarrow is unavailable
+try:
+    from pyarrow import csv as pacsv
+    from pyarrow import json as pajson
+except ImportError:
+    pacsv = None
+    pajson = None
+
 class CsvProfile(DatasetProfile):
     """Profile implementation for CSV datasets."""
     
     def load_data(self):
         """Loads and parses the CSV file."""
         try:
-            df = pd.read_csv(self.dataset_path)
+            if pacsv is not None:
+                table = pacsv.read_csv(
+                    self.dataset_path,
+                    read_options=pacsv.ReadOptions(use_threads=True,
+                                                   block_size=8 << 20))
+                # self_destruct releases Arrow buffers as pandas columns are
+                # built, halving peak memory during conversion
+                df = table.to_pandas(self_destruct=True)
+            else:
+                df = pd.read_csv(self.dataset_path)
             self.row_count = len(df)
             self.metadata["columns"] = list(df.columns)
             self.metadata["file_type"] = "csv"
@@ -25,7 +43,13 @@ class JsonProfile(DatasetProfile):
     def load_data(self):
         """Loads and parses the JSON file."""
         try:
-            df = pd.read_json(self.dataset_path, lines=True)
+            if pajson is not None:
+                table = pajson.read_json(
+                    self.dataset_path,
+                    read_options=pajson.ReadOptions(use_threads=True))
+                df = table.to_pandas(self_destruct=True)
+            else:
+                df = pd.read_json(self.dataset_path, lines=True)
             self.row_count = len(df)
             self.metadata["columns"] = list(df.columns)
             self.metadata["file_type"] = "json"
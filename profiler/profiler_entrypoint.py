@@ -1,6 +1,16 @@
 import pandas as pd
 from profiler.dataset_profile import DatasetProfile
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
 class FakeDatasetProfile:
     def __init__(self, df, path):
         self._df = df
@@ -15,14 +25,40 @@ class FakeDatasetProfile:
         }
 
     def to_json(self):
+        if orjson is not None:
+            return orjson.dumps(
+                self.get_summary(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
+            ).decode()
         import json
         return json.dumps(self.get_summary(), indent=2)
 
+def _read_json_records(path):
+    """Load an ordinary JSON file (array of records or dict of columns) via
+    orjson, which decodes straight from bytes; fall back to pd.read_json."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        if isinstance(data, list):
+            return pd.DataFrame.from_records(data)
+        if isinstance(data, dict):
+            return pd.DataFrame(data)
+    return pd.read_json(path)
+
+
 def profile_dataset(path, *args, **kwargs):
     if path.endswith(".csv"):
-        df = pd.read_csv(path)
+        if pacsv is not None:
+            table = pacsv.read_csv(
+                path,
+                read_options=pacsv.ReadOptions(use_threads=True,
+                                               block_size=8 << 20))
+            df = table.to_pandas(self_destruct=True)
+        else:
+            df = pd.read_csv(path)
     elif path.endswith(".json"):
-        df = pd.read_json(path)
+        df = _read_json_records(path)
     else:
         raise ValueError("Unsupported file format")
 
@@ -1,20 +1,58 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 from datetime import datetime
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(),  # Log to console
-        logging.FileHandler('profiler.log')  # Log to file
-    ]
-)
+from profiler._num_kernels import fused_stats
+
+try:
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Library-style logging: no handlers at import time (a FileHandler here
+# would open profiler.log in every importing process). Applications, or
+# RobustDatasetProfiler(log_file=...), attach handlers explicitly.
 logger = logging.getLogger("dataset_profiler")
+logger.addHandler(logging.NullHandler())
+
+_LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+
+# Recognized boolean spellings (lowercased); numeric 1/0 and Python bools are
+# matched by equality in try_boolean_coercion
+_TRUE_STRS = frozenset({'true', 'yes', 'y', 't', '1'})
+_FALSE_STRS = frozenset({'false', 'no', 'n', 'f', '0'})
+
+# CSVs larger than this are profiled in fixed-row chunks with running
+# accumulators instead of a whole-file load
+_STREAM_THRESHOLD_BYTES = 256 << 20
+_STREAM_CHUNK_ROWS = 2_000_000
+# Per-column uniform sample used for streamed percentile estimates
+_RESERVOIR_SIZE = 100_000
+
+
+def _update_reservoir(buf: np.ndarray, filled: int, seen: int,
+                      values: np.ndarray, rng) -> Tuple[int, int]:
+    """Fold values into a fixed-size uniform sample (Algorithm R, vectorized
+    per chunk). Returns the updated (filled, seen) counters."""
+    cap = buf.shape[0]
+    if filled < cap:
+        take = min(cap - filled, len(values))
+        buf[filled:filled + take] = values[:take]
+        filled += take
+        seen += take
+        values = values[take:]
+    n = len(values)
+    if n:
+        positions = seen + 1 + np.arange(n, dtype=np.int64)
+        accepted = values[rng.random(n) * positions < cap]
+        if len(accepted):
+            buf[rng.integers(0, cap, size=len(accepted))] = accepted
+        seen += n
+    return filled, seen
 
 
 class RobustTypeCoercionMixin:
@@ -24,64 +62,79 @@ class RobustTypeCoercionMixin:
     """
     
     @staticmethod
-    def try_numeric_coercion(series: pd.Series) -> Tuple[pd.Series, Dict[int, Any]]:
+    def try_numeric_coercion(series: pd.Series,
+                             na_mask: Optional[pd.Series] = None) -> Tuple[pd.Series, Dict[int, Any]]:
         """
         Attempt to coerce a series to numeric, capturing invalid values.
-        
+
         Args:
             series: Input pandas Series
-            
+            na_mask: Precomputed series.isna() mask, if the caller already
+                has one — saves a full pass on wide columns
+
         Returns:
-            Tuple containing: 
+            Tuple containing:
             - Coerced series with invalid values as NaN
             - Dictionary mapping row indices to their original invalid values
         """
-        # Store original data for reference
-        original_values = series.copy()
-        
-        # Try to convert to numeric, setting errors as NaN
+        # Try to convert to numeric, setting errors as NaN; only the small
+        # invalid subset of the original values is ever read back, so no
+        # defensive copy of the column is needed
         numeric_series = pd.to_numeric(series, errors='coerce')
-        
+
         # Identify which values couldn't be converted
-        invalid_mask = numeric_series.isna() & ~original_values.isna()
+        if na_mask is None:
+            na_mask = series.isna()
+        invalid_mask = numeric_series.isna() & ~na_mask
         invalid_indices = {}
-        
+
         if invalid_mask.any():
-            # Record the problematic indices and values
-            for idx in invalid_mask[invalid_mask].index:
-                invalid_indices[int(idx)] = original_values.loc[idx]
+            # Record the problematic indices and values: one boolean-indexed
+            # selection instead of a per-row .loc lookup
+            invalid_indices = {int(idx): val
+                               for idx, val in series[invalid_mask].items()}
         
         return numeric_series, invalid_indices
     
     @staticmethod
-    def try_datetime_coercion(series: pd.Series) -> Tuple[pd.Series, Dict[int, Any]]:
+    def try_datetime_coercion(series: pd.Series,
+                              hint_format: Optional[str] = None) -> Tuple[pd.Series, Dict[int, Any]]:
         """
         Attempt to coerce a series to datetime, capturing invalid values.
-        
+
+        Date strings repeat heavily in real datasets, so only the unique
+        values are parsed and the result is mapped back over the column.
+
         Args:
             series: Input pandas Series
-            
+            hint_format: strftime format to parse with, when the caller
+                knows it; otherwise each unique value is parsed individually
+
         Returns:
-            Tuple containing: 
+            Tuple containing:
             - Coerced series with invalid values as NaN
             - Dictionary mapping row indices to their original invalid values
         """
-        # Store original data
-        original_values = series.copy()
-        
         # Try to convert to datetime, setting errors as NaN
         try:
-            datetime_series = pd.to_datetime(series, errors='coerce')
-            
+            na_mask = series.isna()
+            uniques = pd.Index(series.dropna().unique())
+            if hint_format is not None:
+                parsed = pd.to_datetime(uniques, errors='coerce', format=hint_format)
+            else:
+                parsed = pd.to_datetime(uniques, errors='coerce')
+            datetime_series = series.map(dict(zip(uniques, parsed)))
+            datetime_series[na_mask] = pd.NaT
+
             # Identify which values couldn't be converted
-            invalid_mask = datetime_series.isna() & ~original_values.isna()
+            invalid_mask = datetime_series.isna() & ~na_mask
             invalid_indices = {}
             
             if invalid_mask.any():
-                # Record the problematic indices and values
-                for idx in invalid_mask[invalid_mask].index:
-                    invalid_indices[int(idx)] = original_values.loc[idx]
-                    
+                # Record the problematic indices and values in one selection
+                invalid_indices = {int(idx): val
+                                   for idx, val in series[invalid_mask].items()}
+
             return datetime_series, invalid_indices
         
         except Exception as e:
@@ -102,46 +155,88 @@ class RobustTypeCoercionMixin:
             - Coerced series with invalid values as NaN
             - Dictionary mapping row indices to their original invalid values
         """
-        # Store original data
-        original_values = series.copy()
-        
-        # Define valid boolean values
-        true_values = ['true', 'yes', 'y', 't', '1', 1, True]
-        false_values = ['false', 'no', 'n', 'f', '0', 0, False]
-        
-        # Create a new series for results
-        result = pd.Series(index=series.index, dtype='object')
-        invalid_indices = {}
-        
-        # Process each value
-        for idx, val in series.items():
-            if pd.isna(val):
-                result.loc[idx] = np.nan
-            elif isinstance(val, str) and val.lower() in [str(x).lower() for x in true_values]:
-                result.loc[idx] = True
-            elif isinstance(val, str) and val.lower() in [str(x).lower() for x in false_values]:
-                result.loc[idx] = False
-            elif val in true_values:
-                result.loc[idx] = True
-            elif val in false_values:
-                result.loc[idx] = False
-            else:
-                result.loc[idx] = np.nan
-                invalid_indices[int(idx)] = original_values.loc[idx]
-        
+        # Already-boolean columns need no string casting or mask work
+        if pd.api.types.is_bool_dtype(series):
+            return series.astype(object), {}
+
+        # Build the result with a handful of vectorized passes instead of a
+        # Python loop with per-row .loc assignments
+        notna = series.notna()
+        lowered = series.astype(str).str.lower()
+        true_mask = (lowered.isin(_TRUE_STRS) | (series == 1)) & notna
+        false_mask = (lowered.isin(_FALSE_STRS) | (series == 0)) & notna & ~true_mask
+
+        result = pd.Series(np.full(len(series), np.nan, dtype=object),
+                           index=series.index, dtype='object')
+        result[true_mask] = True
+        result[false_mask] = False
+
+        invalid_mask = notna & ~true_mask & ~false_mask
+        invalid_indices = {int(idx): val
+                           for idx, val in series[invalid_mask].items()}
+
         return result, invalid_indices
     
+    # Analysis results keyed by id(series); the Series object is pinned in the
+    # value and re-checked by identity so a recycled id cannot produce a
+    # false hit
+    _analysis_cache: Dict[int, Tuple[pd.Series, Dict[str, Any]]] = {}
+    _ANALYSIS_CACHE_MAX = 256
+
     @staticmethod
     def analyze_type_consistency(series: pd.Series) -> Dict[str, Any]:
         """
         Analyze a series for type consistency and attempt to detect the most likely type.
-        
+
         Args:
             series: Input pandas Series
-            
+
         Returns:
             Dictionary with type analysis results
         """
+        cache = RobustTypeCoercionMixin._analysis_cache
+        cached = cache.get(id(series))
+        if cached is not None and cached[0] is series:
+            return cached[1]
+
+        result = RobustTypeCoercionMixin._analyze_type_consistency_uncached(series)
+
+        if len(cache) >= RobustTypeCoercionMixin._ANALYSIS_CACHE_MAX:
+            cache.clear()
+        cache[id(series)] = (series, result)
+        return result
+
+    @staticmethod
+    def _analyze_type_consistency_uncached(series: pd.Series) -> Dict[str, Any]:
+        # Columns that already carry a concrete dtype (parquet/arrow loads,
+        # typed CSV reads) need no coercion probes at all — the dtype is the
+        # answer. Empty/all-null columns fall through to the generic path so
+        # they still report "unknown"
+        dt = series.dtype
+        if pd.api.types.is_bool_dtype(dt):
+            likely_type = "boolean"
+            coercion_rates = {"numeric": 100.0, "datetime": 0.0,
+                              "boolean": 100.0, "string": 100.0}
+        elif pd.api.types.is_numeric_dtype(dt):
+            likely_type = "numeric"
+            coercion_rates = {"numeric": 100.0, "datetime": 0.0,
+                              "boolean": 0.0, "string": 100.0}
+        elif pd.api.types.is_datetime64_any_dtype(dt):
+            likely_type = "datetime"
+            coercion_rates = {"numeric": 0.0, "datetime": 100.0,
+                              "boolean": 0.0, "string": 100.0}
+        else:
+            likely_type = None
+        if likely_type is not None:
+            valid_count = int(series.notna().sum())
+            if valid_count > 0:
+                return {
+                    "likely_type": likely_type,
+                    "type_consistency": 100.0,
+                    "type_counts": {str(dt.type): valid_count},
+                    "coercion_rates": coercion_rates
+                }
+
         # Drop NA values for type analysis
         valid_values = series.dropna()
         
@@ -152,25 +247,76 @@ class RobustTypeCoercionMixin:
                 "type_counts": {}
             }
         
-        # Count Python types in the series
-        type_counts = valid_values.apply(type).value_counts().to_dict()
-        
+        total = len(valid_values)
+
+        # Low-cardinality object columns: probe only the unique values and
+        # weight outcomes by their frequencies — per-unique work instead of
+        # per-row work
+        probe_values = valid_values
+        weights = None
+        type_counts = None
+        if valid_values.dtype == object:
+            try:
+                counts = valid_values.value_counts()
+            except TypeError:  # unhashable values present
+                counts = None
+            if counts is not None and len(counts) < max(100, total // 20) and len(counts) < total:
+                probe_values = pd.Series(counts.index)
+                weights = counts
+                type_counts = {}
+                for val, cnt in counts.items():
+                    val_type = type(val)
+                    type_counts[val_type] = type_counts.get(val_type, 0) + int(cnt)
+
+        if type_counts is None:
+            if valid_values.dtype == object:
+                # np.frompyfunc maps type() over the raw object buffer in a
+                # C loop — far cheaper than Series.apply. On very large
+                # columns, infer from a fixed-size sample and scale up
+                obj_arr = valid_values.to_numpy()
+                scale = 1.0
+                if total > 100_000:
+                    rng = np.random.default_rng(42)
+                    obj_arr = rng.choice(obj_arr, size=100_000, replace=False)
+                    scale = total / 100_000
+                types = np.frompyfunc(type, 1, 1)(obj_arr)
+                # value_counts is hash-based; np.unique would try to sort
+                # type objects, which aren't orderable
+                type_counts = {t: int(round(cnt * scale)) for t, cnt
+                               in pd.Series(types).value_counts().items()}
+            else:
+                # Homogeneous dtype: every row shares the dtype's scalar type
+                type_counts = {valid_values.dtype.type: total}
+
+        def failed_count(errors: Dict[int, Any]) -> int:
+            """Rows that failed a probe, rescaled by frequency when probing
+            unique values only."""
+            if weights is None:
+                return len(errors)
+            return int(sum(weights.get(v, 0) for v in errors.values()))
+
         # Calculate percentage of the most common type
         most_common_type = max(type_counts.items(), key=lambda x: x[1])
-        type_consistency = most_common_type[1] / len(valid_values) * 100
-        
+        type_consistency = most_common_type[1] / total * 100
+
         # Type detection heuristics
         # Try numeric coercion and check success rate
-        numeric_series, numeric_errors = RobustTypeCoercionMixin.try_numeric_coercion(valid_values)
-        numeric_success_rate = (len(valid_values) - len(numeric_errors)) / len(valid_values) * 100
-        
-        # Try datetime coercion and check success rate
-        datetime_series, datetime_errors = RobustTypeCoercionMixin.try_datetime_coercion(valid_values)
-        datetime_success_rate = (len(valid_values) - len(datetime_errors)) / len(valid_values) * 100
-        
+        _, numeric_errors = RobustTypeCoercionMixin.try_numeric_coercion(probe_values)
+        numeric_success_rate = (total - failed_count(numeric_errors)) / total * 100
+
+        # Try datetime coercion and check success rate. The parse is by far
+        # the most expensive probe, so only attempt it on string-like data —
+        # already-numeric columns would only "succeed" as epoch offsets
+        if pd.api.types.infer_dtype(probe_values, skipna=True) in (
+                'string', 'mixed', 'mixed-integer', 'date', 'datetime', 'datetime64'):
+            _, datetime_errors = RobustTypeCoercionMixin.try_datetime_coercion(probe_values)
+            datetime_success_rate = (total - failed_count(datetime_errors)) / total * 100
+        else:
+            datetime_success_rate = 0.0
+
         # Try boolean coercion and check success rate
-        boolean_series, boolean_errors = RobustTypeCoercionMixin.try_boolean_coercion(valid_values)
-        boolean_success_rate = (len(valid_values) - len(boolean_errors)) / len(valid_values) * 100
+        _, boolean_errors = RobustTypeCoercionMixin.try_boolean_coercion(probe_values)
+        boolean_success_rate = (total - failed_count(boolean_errors)) / total * 100
         
         # Determine most likely type based on coercion success
         coercion_rates = {
@@ -203,31 +349,38 @@ class RobustNumericProfiler(RobustTypeCoercionMixin):
     """Robustly profiles numeric columns, handling mixed data types."""
     
     @staticmethod
-    def profile_series(series: pd.Series, 
+    def profile_series(series: pd.Series,
                       column_name: Optional[str] = None,
-                      use_typed_model: bool = False) -> Dict[str, Any]:
+                      use_typed_model: bool = False,
+                      type_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Robustly profile a numeric series, handling mixed types and errors.
-        
+
         Args:
             series: The pandas Series to profile
             column_name: Name of the column (used in logging)
             use_typed_model: Whether to return a typed model (not implemented)
-            
+            type_analysis: Precomputed analyze_type_consistency result, to
+                avoid re-running the coercion probes
+
         Returns:
             Dictionary containing numeric profile statistics
         """
         actual_name = column_name or series.name or "unnamed_column"
+
+        # Analyze type consistency (unless the caller already did)
+        if type_analysis is None:
+            type_analysis = RobustNumericProfiler.analyze_type_consistency(series)
         
-        # Analyze type consistency
-        type_analysis = RobustNumericProfiler.analyze_type_consistency(series)
-        
-        # Start with basic counts before any type coercion
+        # Start with basic counts before any type coercion; the null mask is
+        # computed once and shared with the coercion below
         total_count = len(series)
-        original_null_count = series.isna().sum()
-        
+        na_orig = series.isna()
+        original_null_count = na_orig.sum()
+
         # Attempt numeric coercion, capturing invalid values
-        numeric_series, invalid_values = RobustNumericProfiler.try_numeric_coercion(series)
+        numeric_series, invalid_values = RobustNumericProfiler.try_numeric_coercion(
+            series, na_mask=na_orig)
         
         # Count nulls after coercion
         post_coercion_null_count = numeric_series.isna().sum()
@@ -262,20 +415,51 @@ class RobustNumericProfiler(RobustTypeCoercionMixin):
         # If we have valid numeric data, calculate statistics
         if valid_count > 0:
             try:
-                # Basic statistics
-                result.update({
-                    "mean": float(valid_numeric.mean()),
-                    "min": float(valid_numeric.min()),
-                    "max": float(valid_numeric.max()),
-                    "sum": float(valid_numeric.sum()),
-                    "std": float(valid_numeric.std()) if len(valid_numeric) > 1 else None,
-                })
-                
+                if fused_stats is not None:
+                    # One jitted pass over the raw buffer yields the moments
+                    # and sign counts that otherwise take seven+ reductions.
+                    # Narrow source dtypes (<=4 bytes) go through as float32 —
+                    # half the memory bandwidth — while the kernel's float64
+                    # accumulators keep the sums at full precision.
+                    if valid_numeric.dtype.itemsize <= 4:
+                        arr = valid_numeric.to_numpy(dtype=np.float32, copy=False)
+                    else:
+                        arr = valid_numeric.to_numpy(dtype=np.float64, copy=False)
+                    total, total_sq, mn, mx, zero, neg, pos = fused_stats(arr)
+                    mean = total / valid_count
+                    if valid_count > 1:
+                        variance = (total_sq - valid_count * mean * mean) / (valid_count - 1)
+                        std = float(np.sqrt(variance)) if variance > 0 else 0.0
+                    else:
+                        std = None
+                    result.update({
+                        "mean": float(mean),
+                        "min": float(mn),
+                        "max": float(mx),
+                        "sum": float(total),
+                        "std": std,
+                        "zero_count": int(zero),
+                        "negative_count": int(neg),
+                        "positive_count": int(pos),
+                    })
+                else:
+                    # Basic statistics
+                    result.update({
+                        "mean": float(valid_numeric.mean()),
+                        "min": float(valid_numeric.min()),
+                        "max": float(valid_numeric.max()),
+                        "sum": float(valid_numeric.sum()),
+                        "std": float(valid_numeric.std()) if len(valid_numeric) > 1 else None,
+                        "zero_count": int((valid_numeric == 0).sum()),
+                        "negative_count": int((valid_numeric < 0).sum()),
+                        "positive_count": int((valid_numeric > 0).sum()),
+                    })
+
                 # Calculate percentiles if we have enough data
                 if len(valid_numeric) >= 5:  # Arbitrary threshold for meaningful percentiles
                     percentiles = [0.1, 0.25, 0.5, 0.75, 0.9]
                     percentile_values = np.percentile(valid_numeric, [p * 100 for p in percentiles])
-                    
+
                     result.update({
                         "p10": float(percentile_values[0]),
                         "q1": float(percentile_values[1]),
@@ -284,14 +468,7 @@ class RobustNumericProfiler(RobustTypeCoercionMixin):
                         "p90": float(percentile_values[4]),
                         "iqr": float(percentile_values[3] - percentile_values[1])
                     })
-                
-                # Check for zeros, negative values
-                result.update({
-                    "zero_count": int((valid_numeric == 0).sum()),
-                    "negative_count": int((valid_numeric < 0).sum()),
-                    "positive_count": int((valid_numeric > 0).sum()),
-                })
-                
+
             except Exception as e:
                 # Catch any other errors during statistical calculation
                 logger.error(f"Error calculating statistics for column '{actual_name}': {str(e)}")
@@ -317,7 +494,8 @@ class RobustNumericProfiler(RobustTypeCoercionMixin):
             Dictionary mapping column names to their numeric profiles
         """
         results = {}
-        
+        analyses: Dict[str, Dict[str, Any]] = {}
+
         # If no specific columns provided, detect numeric columns
         if numeric_columns is None:
             # Start with columns pandas classifies as numeric
@@ -325,12 +503,14 @@ class RobustNumericProfiler(RobustTypeCoercionMixin):
             
             # If inference enabled, analyze all other columns for potential numeric data
             if infer_numeric:
-                non_numeric_columns = [col for col in df.columns if col not in numeric_columns]
+                numeric_set = set(numeric_columns)
+                non_numeric_columns = [col for col in df.columns if col not in numeric_set]
                 
                 for col in non_numeric_columns:
                     try:
                         type_analysis = RobustNumericProfiler.analyze_type_consistency(df[col])
-                        
+                        analyses[col] = type_analysis
+
                         # If column looks like it contains mostly numeric data
                         if (type_analysis["likely_type"] == "numeric" and 
                             type_analysis["coercion_rates"]["numeric"] >= min_type_consistency):
@@ -342,21 +522,34 @@ class RobustNumericProfiler(RobustTypeCoercionMixin):
                     except Exception as e:
                         logger.warning(f"Error analyzing column '{col}': {str(e)}")
         
-        # Profile each numeric column
+        # Profile each numeric column; the columns are independent, so fan
+        # them out across a thread pool (pandas/numpy reductions release the
+        # GIL, as does the numba kernel when present)
+        def _profile_one(col: str) -> Dict[str, Any]:
+            try:
+                return RobustNumericProfiler.profile_series(
+                    df[col], col, type_analysis=analyses.get(col))
+            except Exception as e:
+                logger.error(f"Failed to profile column '{col}': {str(e)}")
+                return {
+                    "column_name": col,
+                    "error": str(e),
+                    "profiling_success": False
+                }
+
+        present = []
         for col in numeric_columns:
             if col in df.columns:
-                try:
-                    results[col] = RobustNumericProfiler.profile_series(df[col], col)
-                except Exception as e:
-                    logger.error(f"Failed to profile column '{col}': {str(e)}")
-                    results[col] = {
-                        "column_name": col,
-                        "error": str(e),
-                        "profiling_success": False
-                    }
+                present.append(col)
             else:
                 logger.warning(f"Column '{col}' specified but not found in dataframe")
-        
+
+        if len(present) > 1:
+            with ThreadPoolExecutor() as executor:
+                results = dict(zip(present, executor.map(_profile_one, present)))
+        else:
+            results = {col: _profile_one(col) for col in present}
+
         return results
 
 
@@ -367,16 +560,23 @@ class RobustDatasetProfiler:
     and integrates results into a unified dataset profile.
     """
     
-    def __init__(self, log_level=logging.INFO):
+    def __init__(self, log_level=logging.INFO, log_file: Optional[str] = None):
         """
         Initialize the profiler with specified log level.
-        
+
         Args:
             log_level: Logging level (default: INFO)
+            log_file: Path to a log file; opened lazily here rather than at
+                module import, so library use keeps no file descriptor open
         """
         self.logger = logger
         self.logger.setLevel(log_level)
-        
+
+        if log_file is not None:
+            handler = logging.FileHandler(log_file)
+            handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+            self.logger.addHandler(handler)
+
         # Track profiling operations
         self.operation_log = []
     
@@ -390,32 +590,55 @@ class RobustDatasetProfiler:
             
         self.operation_log.append(log_entry)
     
-    def profile_csv(self, csv_path: str, **kwargs) -> Dict[str, Any]:
+    def profile_csv(self, csv_path: str,
+                    chunksize: Optional[int] = None, **kwargs) -> Dict[str, Any]:
         """
         Profile a CSV file with robust error handling.
-        
+
+        Files larger than working memory are profiled in fixed-row chunks
+        with running accumulators, so memory stays bounded by column count
+        rather than row count.
+
         Args:
             csv_path: Path to the CSV file
+            chunksize: Rows per streamed chunk. Defaults to None, which
+                streams automatically for files over 256 MiB and loads
+                smaller files whole
             kwargs: Additional arguments for pandas.read_csv()
-            
+
         Returns:
             Dictionary containing the complete dataset profile
         """
         self.log_operation("profile_csv", {"path": csv_path})
-        
+
         if not os.path.exists(csv_path):
             self.logger.error(f"CSV file not found: {csv_path}")
             return {"error": f"File not found: {csv_path}"}
-        
+
+        if chunksize is not None or os.path.getsize(csv_path) > _STREAM_THRESHOLD_BYTES:
+            return self._profile_csv_streaming(
+                csv_path, chunksize or _STREAM_CHUNK_ROWS, **kwargs)
+
         try:
             # Attempt to read CSV with pandas, capturing any parsing errors
             try:
-                # First try standard read_csv with some common options
-                df = pd.read_csv(
-                    csv_path, 
-                    low_memory=False,  # Avoid mixed type inference issues
-                    **kwargs
-                )
+                if pacsv is not None and not kwargs:
+                    # Multi-threaded C++ parse; skip rows with the wrong
+                    # column count like on_bad_lines='skip' would
+                    table = pacsv.read_csv(
+                        csv_path,
+                        read_options=pacsv.ReadOptions(use_threads=True,
+                                                       block_size=8 << 20),
+                        parse_options=pacsv.ParseOptions(
+                            invalid_row_handler=lambda row: 'skip'))
+                    df = table.to_pandas(self_destruct=True)
+                else:
+                    # First try standard read_csv with some common options
+                    df = pd.read_csv(
+                        csv_path,
+                        low_memory=False,  # Avoid mixed type inference issues
+                        **kwargs
+                    )
             except Exception as e:
                 self.logger.warning(f"Initial CSV parse failed, trying with error handling: {str(e)}")
                 # If that fails, try with more error handling options
@@ -464,10 +687,15 @@ class RobustDatasetProfiler:
                     "profile": num_profile
                 }
             
-            # Calculate summary
-            missing_cells = sum(prof["profile"].get("null_count", 0) + 
-                               prof["profile"].get("invalid_count", 0) 
-                               for prof in profile["column_profiles"].values())
+            # Calculate summary: reduce per-column counts as one numpy
+            # vector rather than a Python-level sum over dict lookups
+            col_profiles = profile["column_profiles"].values()
+            missing_per_col = np.fromiter(
+                (prof["profile"].get("null_count", 0) +
+                 prof["profile"].get("invalid_count", 0)
+                 for prof in col_profiles),
+                dtype=np.int64, count=len(col_profiles))
+            missing_cells = int(missing_per_col.sum())
             
             total_cells = row_count * column_count
             missing_cells_pct = (missing_cells / total_cells * 100) if total_cells > 0 else 0
@@ -491,6 +719,190 @@ class RobustDatasetProfiler:
                 "operation_log": self.operation_log
             }
 
+    def _profile_csv_streaming(self, csv_path: str, chunk_rows: int,
+                               **kwargs) -> Dict[str, Any]:
+        """
+        Profile a CSV in chunks, folding each into running accumulators.
+
+        Numeric columns are decided on the first chunk (same inference as
+        profile_dataframe); each subsequent chunk updates count/sum/
+        sum-of-squares/min/max/sign accumulators — via the fused numba
+        kernel when available — plus a bounded uniform reservoir per column
+        from which percentiles are estimated at the end.
+
+        Returns:
+            Same profile layout as the whole-file path. Percentiles are
+            sample estimates and invalid_indices is left empty, since row
+            positions are not retained across chunks.
+        """
+        self.logger.info(f"Streaming CSV profile in chunks of {chunk_rows} rows")
+        rng = np.random.default_rng(42)
+        acc: Dict[str, Dict[str, Any]] = {}
+        analyses: Dict[str, Dict[str, Any]] = {}
+        columns: List[str] = []
+        row_count = 0
+
+        try:
+            for chunk in pd.read_csv(csv_path, low_memory=False,
+                                     chunksize=chunk_rows, **kwargs):
+                if not columns:
+                    # First chunk: fix the column set and pick the numeric
+                    # columns, including object columns that coerce cleanly
+                    columns = list(chunk.columns)
+                    numeric_columns = chunk.select_dtypes(include=["number"]).columns.tolist()
+                    numeric_set = set(numeric_columns)
+                    for col in columns:
+                        if col in numeric_set:
+                            continue
+                        try:
+                            analysis = RobustNumericProfiler.analyze_type_consistency(chunk[col])
+                        except Exception as e:
+                            self.logger.warning(f"Error analyzing column '{col}': {str(e)}")
+                            continue
+                        analyses[col] = analysis
+                        if (analysis["likely_type"] == "numeric" and
+                                analysis["coercion_rates"]["numeric"] >= 70.0):
+                            numeric_columns.append(col)
+                    for col in numeric_columns:
+                        acc[col] = {
+                            "null": 0, "invalid": 0, "valid": 0,
+                            "total": 0.0, "total_sq": 0.0,
+                            "min": np.inf, "max": -np.inf,
+                            "zero": 0, "neg": 0, "pos": 0,
+                            "sample_invalid": [],
+                            "reservoir": np.empty(_RESERVOIR_SIZE, dtype=np.float64),
+                            "filled": 0, "seen": 0,
+                        }
+
+                row_count += len(chunk)
+                for col, a in acc.items():
+                    series = chunk[col]
+                    na_mask = series.isna()
+                    numeric_series = pd.to_numeric(series, errors='coerce')
+                    invalid_mask = numeric_series.isna() & ~na_mask
+                    a["null"] += int(na_mask.sum())
+                    n_invalid = int(invalid_mask.sum())
+                    a["invalid"] += n_invalid
+                    if n_invalid and len(a["sample_invalid"]) < 5:
+                        a["sample_invalid"].extend(
+                            series[invalid_mask].head(
+                                5 - len(a["sample_invalid"])).tolist())
+
+                    values = numeric_series.dropna().to_numpy(dtype=np.float64,
+                                                              copy=False)
+                    if not len(values):
+                        continue
+                    a["valid"] += len(values)
+                    if fused_stats is not None:
+                        total, total_sq, mn, mx, zero, neg, pos = fused_stats(values)
+                    else:
+                        total = float(values.sum())
+                        total_sq = float(np.square(values).sum())
+                        mn, mx = float(values.min()), float(values.max())
+                        zero = int((values == 0).sum())
+                        neg = int((values < 0).sum())
+                        pos = int((values > 0).sum())
+                    a["total"] += float(total)
+                    a["total_sq"] += float(total_sq)
+                    a["min"] = min(a["min"], float(mn))
+                    a["max"] = max(a["max"], float(mx))
+                    a["zero"] += int(zero)
+                    a["neg"] += int(neg)
+                    a["pos"] += int(pos)
+                    a["filled"], a["seen"] = _update_reservoir(
+                        a["reservoir"], a["filled"], a["seen"], values, rng)
+
+            # Finalize per-column profiles from the accumulators
+            column_profiles = {}
+            for col, a in acc.items():
+                valid_count = a["valid"]
+                analysis = analyses.get(col)
+                result = {
+                    "column_name": col,
+                    "count": row_count,
+                    "null_count": a["null"],
+                    "invalid_count": a["invalid"],
+                    "valid_count": valid_count,
+                    "null_percent": (a["null"] / row_count * 100) if row_count > 0 else 0,
+                    "invalid_percent": (a["invalid"] / row_count * 100) if row_count > 0 else 0,
+                    "type_consistency": analysis["type_consistency"] if analysis else 100.0,
+                    "likely_type": analysis["likely_type"] if analysis else "numeric",
+                    "sample_invalid_values": a["sample_invalid"][:5],
+                    "invalid_indices": []
+                }
+                if valid_count > 0:
+                    mean = a["total"] / valid_count
+                    if valid_count > 1:
+                        variance = (a["total_sq"] - valid_count * mean * mean) / (valid_count - 1)
+                        std = float(np.sqrt(variance)) if variance > 0 else 0.0
+                    else:
+                        std = None
+                    result.update({
+                        "mean": float(mean),
+                        "min": a["min"],
+                        "max": a["max"],
+                        "sum": a["total"],
+                        "std": std,
+                        "zero_count": a["zero"],
+                        "negative_count": a["neg"],
+                        "positive_count": a["pos"],
+                    })
+                    sample = a["reservoir"][:a["filled"]]
+                    if valid_count >= 5 and len(sample) >= 5:
+                        percentile_values = np.percentile(sample, [10, 25, 50, 75, 90])
+                        result.update({
+                            "p10": float(percentile_values[0]),
+                            "q1": float(percentile_values[1]),
+                            "median": float(percentile_values[2]),
+                            "q3": float(percentile_values[3]),
+                            "p90": float(percentile_values[4]),
+                            "iqr": float(percentile_values[3] - percentile_values[1])
+                        })
+                column_profiles[col] = {"type": "numeric", "profile": result}
+
+            file_size = os.path.getsize(csv_path)
+            column_count = len(columns)
+            dataset_info = {
+                "file_path": csv_path,
+                "file_name": os.path.basename(csv_path),
+                "file_size_bytes": file_size,
+                "row_count": row_count,
+                "column_count": column_count,
+                "columns": columns,
+                "profiling_timestamp": datetime.now().isoformat()
+            }
+
+            missing_per_col = np.fromiter(
+                (prof["profile"].get("null_count", 0) +
+                 prof["profile"].get("invalid_count", 0)
+                 for prof in column_profiles.values()),
+                dtype=np.int64, count=len(column_profiles))
+            missing_cells = int(missing_per_col.sum())
+            total_cells = row_count * column_count
+            missing_cells_pct = (missing_cells / total_cells * 100) if total_cells > 0 else 0
+
+            return {
+                "dataset_info": dataset_info,
+                "column_profiles": column_profiles,
+                "profiling_summary": {
+                    "total_rows": row_count,
+                    "total_columns": column_count,
+                    "numeric_columns": len(column_profiles),
+                    "missing_cells": missing_cells,
+                    "missing_cells_percent": missing_cells_pct,
+                    "completeness": 100 - missing_cells_pct
+                },
+                "operation_log": self.operation_log
+            }
+
+        except Exception as e:
+            self.logger.error(f"Failed to profile CSV {csv_path}: {str(e)}", exc_info=True)
+            return {
+                "error": str(e),
+                "file_path": csv_path,
+                "operation_log": self.operation_log
+            }
+
 
 # Testing code
 def test_with_problematic_csv():
@@ -33,7 +33,7 @@ class DriftReport:
         return self.exit_code.value
 
     def to_text(self) -> str:
-        lines = ["Drift Report Summary:"]
-        for v in self.violations:
-            lines.append(f"- [{v.severity.upper()}] {v.message}")
-        return "\n".join(lines)
+        return "\n".join(
+            ["Drift Report Summary:"]
+            + [f"- [{v.severity.upper()}] {v.message}" for v in self.violations]
+        )
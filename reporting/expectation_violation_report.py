@@ -1,3 +1,4 @@
+import operator as _operator
 from typing import Any
 
 # Placeholder base classes for context
@@ -15,10 +16,24 @@ class ValidationResult:
 class NullPercentageExpectation(ColumnExpectation):
     """Validate that null percentage of a column is within the expected threshold."""
 
+    # Comparison dispatch table — one hash lookup instead of a branch chain
+    _OPS = {
+        "<": _operator.lt,
+        "<=": _operator.le,
+        ">": _operator.gt,
+        ">=": _operator.ge,
+        "==": _operator.eq,
+    }
+
     def __init__(self, column_name: str, threshold: float, operator: str = "<"):
         super().__init__(column_name)
         self.threshold = threshold
         self.operator = operator
+        try:
+            # Resolved once, so validate() skips even the dict lookup
+            self._op_fn = self._OPS[operator]
+        except KeyError:
+            raise ValueError(f"Unsupported comparison operator: '{operator}'")
 
     def validate(self, dataset_summaries) -> ValidationResult:
         column_stats = dataset_summaries.get_column_stats(self.column_name)
@@ -32,7 +47,7 @@ class NullPercentageExpectation(ColumnExpectation):
                 expected_value=self.threshold
             )
 
-        is_valid = self._compare(actual_null_percent, self.threshold, self.operator)
+        is_valid = self._op_fn(actual_null_percent, self.threshold)
 
         return ValidationResult(
             is_valid=is_valid,
@@ -42,17 +57,9 @@ class NullPercentageExpectation(ColumnExpectation):
         )
 
     def _compare(self, actual: float, expected: float, operator: str) -> bool:
-        if operator == "<":
-            return actual < expected
-        elif operator == "<=":
-            return actual <= expected
-        elif operator == ">":
-            return actual > expected
-        elif operator == ">=":
-            return actual >= expected
-        elif operator == "==":
-            return actual == expected
-        else:
+        try:
+            return self._OPS[operator](actual, expected)
+        except KeyError:
             raise ValueError(f"Unsupported comparison operator: '{operator}'")
 
     def _generate_message(self, is_valid: bool, actual: float) -> str:
@@ -1,30 +1,63 @@
+from typing import Any, Dict, Tuple
+
+# Metric cache shared across LazyProfiler instances, so re-profiling the
+# same dataset object never redoes work. Keys carry id(dataset); each entry
+# also pins the dataset itself, and is only trusted after an identity check,
+# so a recycled id() cannot alias a different object
+_METRIC_CACHE: Dict[Tuple[int, str, str], Tuple[Any, Any]] = {}
+_METRIC_CACHE_MAX = 1024
+
+
 class LazyProfiler:
     """Generate profiles lazily as needed."""
-    
+
     def __init__(self, dataset):
         self.dataset = dataset
         self.computed_columns = {}
-        
+
     def get_column_profile(self, column, metrics=None):
         """Get profile for a specific column, computing only if needed."""
         if column not in self.computed_columns:
             self.computed_columns[column] = {}
-            
-        # Check which metrics we need to compute
+
+        computed = self.computed_columns[column]
+
+        # Check which metrics we need to compute, consulting the shared
+        # cache before resorting to actual computation
         metrics_to_compute = []
         if metrics:
             for metric in metrics:
-                if metric not in self.computed_columns[column]:
+                if metric in computed:
+                    continue
+                cached = _METRIC_CACHE.get((id(self.dataset), column, metric))
+                if cached is not None and cached[0] is self.dataset:
+                    computed[metric] = cached[1]
+                else:
                     metrics_to_compute.append(metric)
-        
+
         # If we need to compute anything, do it
         if metrics_to_compute:
             new_metrics = self._compute_column_metrics(column, metrics_to_compute)
-            self.computed_columns[column].update(new_metrics)
-            
+            computed.update(new_metrics)
+            if len(_METRIC_CACHE) + len(new_metrics) > _METRIC_CACHE_MAX:
+                _METRIC_CACHE.clear()
+            for metric, value in new_metrics.items():
+                _METRIC_CACHE[(id(self.dataset), column, metric)] = (self.dataset, value)
+
         # Return the requested metrics
         if metrics:
-            return {metric: self.computed_columns[column].get(metric) 
+            return {metric: computed.get(metric)
                    for metric in metrics}
         else:
-            return self.computed_columns[column]
\ No newline at end of file
+            return computed
+
+    def invalidate(self, dataset=None):
+        """Drop cached metrics for a dataset (default: this profiler's own),
+        e.g. after the underlying data has been mutated."""
+        target = self.dataset if dataset is None else dataset
+        stale = [key for key, entry in _METRIC_CACHE.items()
+                 if entry[0] is target]
+        for key in stale:
+            del _METRIC_CACHE[key]
+        if target is self.dataset:
+            self.computed_columns = {}
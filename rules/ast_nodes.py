@@ -1,20 +1,56 @@
+_COMPARISON_OPS = {'==', '!=', '<', '<=', '>', '>='}
+
+
 class FunctionCall:
     def __init__(self, func_name, field_name):
         self.func_name = func_name
         self.field_name = field_name
 
+    def to_python(self, ctx_name='row'):
+        return f"_FN[{self.func_name!r}]({ctx_name}, {self.field_name!r})"
+
 class Comparison:
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
         self.right = right
 
+    def to_python(self, ctx_name='row'):
+        if self.operator not in _COMPARISON_OPS:
+            raise ValueError(f"Unknown comparison operator: '{self.operator}'")
+        return (f"({self.left.to_python(ctx_name)} {self.operator} "
+                f"{self.right.to_python(ctx_name)})")
+
 class LogicalExpression:
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator  # AND / OR
         self.right = right
 
+    def to_python(self, ctx_name='row'):
+        op = self.operator.upper()
+        if op not in ('AND', 'OR'):
+            raise ValueError(f"Unknown logical operator: '{op}'")
+        return (f"({self.left.to_python(ctx_name)} "
+                f"{'and' if op == 'AND' else 'or'} "
+                f"{self.right.to_python(ctx_name)})")
+
 class Literal:
     def __init__(self, value):
         self.value = value
+
+    def to_python(self, ctx_name='row'):
+        return repr(self.value)
+
+
+def compile_ast(root, function_registry, ctx_name='row'):
+    """Compile an AST once into a plain Python closure.
+
+    The returned callable evaluates the whole expression with zero node
+    dispatch per call — the tree is rendered to source via to_python and
+    compiled by the interpreter at registration time. With ctx_name='df'
+    and functions that accept a dataframe, the same closure evaluates
+    vectorized over every row at once.
+    """
+    source = f"lambda {ctx_name}: {root.to_python(ctx_name)}"
+    return eval(source, {'_FN': dict(function_registry)})
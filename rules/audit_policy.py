@@ -7,7 +7,12 @@ from rules.enforcement_mode import EnforcementMode
 from rules.thresholds import ThresholdConfig
 from rules.schema_compatibility import SchemaCompatibilityConfig
 
-@dataclass
+# Value -> member maps: Enum's by-value construction is a linear scan, and
+# from_dict runs it once or twice per rule
+_SEV = {s.value: s for s in Severity}
+_ENF = {m.value: m for m in EnforcementMode}
+
+@dataclass(slots=True)
 class AuditPolicy:
     """
     Central configuration object for data quality auditing.
@@ -31,6 +36,12 @@ class AuditPolicy:
     })
     extends: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # to_dict memoization; key is a structural fingerprint of the fields
+    # that feed the dict, so unchanged policies skip the rebuild
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _dict_cache_key: Any = field(
+        default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, config: Dict[str, Any]) -> "AuditPolicy":
@@ -38,16 +49,23 @@ class AuditPolicy:
         # Parse rules
         rules = []
         for rule_dict in config.get('rules', []):
+            # Resolve each string once; unknown values fall through to the
+            # enum constructor so malformed policies still raise ValueError
+            severity_val = rule_dict.get('severity', 'error')
+            enforcement_val = rule_dict.get(
+                'enforcement', config.get('default_enforcement', 'enforce'))
             rule = RuleConfig(
                 name=rule_dict['name'],
                 condition=rule_dict['condition'],
-                severity=Severity(rule_dict.get('severity', 'error')),
+                severity=_SEV.get(severity_val) or Severity(severity_val),
                 message=rule_dict.get('message'),
-                enforcement=EnforcementMode(rule_dict.get('enforcement', config.get('default_enforcement', 'enforce'))),
+                enforcement=_ENF.get(enforcement_val)
+                            or EnforcementMode(enforcement_val),
                 fail_fast=rule_dict.get('fail_fast', False),
                 exit_code=rule_dict.get('exit_code'),
                 metadata=rule_dict.get('metadata', {})
             )
+            rule.compile_condition()
             rules.append(rule)
 
         # Load thresholds and schema config
@@ -67,6 +85,7 @@ class AuditPolicy:
         if 'default_exit_codes' in config:
             default_exit_codes.update(config['default_exit_codes'])
 
+        default_enforcement_val = config.get('default_enforcement', 'enforce')
         return cls(
             name=config['name'],
             description=config.get('description'),
@@ -74,7 +93,8 @@ class AuditPolicy:
             rules=rules,
             thresholds=thresholds,
             schema_compatibility=schema_compatibility,
-            default_enforcement=EnforcementMode(config.get('default_enforcement', 'enforce')),
+            default_enforcement=_ENF.get(default_enforcement_val)
+                                or EnforcementMode(default_enforcement_val),
             enable_fail_fast=config.get('enable_fail_fast', True),
             default_exit_codes=default_exit_codes,
             extends=config.get('extends'),
@@ -82,7 +102,23 @@ class AuditPolicy:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert policy to dictionary representation."""
+        """Convert policy to dictionary representation.
+
+        The result is cached against a fingerprint of the policy's fields
+        (rule identities plus the scalar settings); report writers calling
+        this repeatedly on an unchanged policy get the same dict back.
+        Treat it as read-only — replacing a rule or setting invalidates
+        the cache, mutating the returned dict does not.
+        """
+        cache_key = (
+            tuple(id(rule) for rule in self.rules),
+            id(self.thresholds), id(self.schema_compatibility),
+            self.name, self.description, self.version,
+            self.default_enforcement, self.enable_fail_fast, self.extends,
+        )
+        if self._dict_cache is not None and self._dict_cache_key == cache_key:
+            return self._dict_cache
+
         rules_dict = [
             {
                 'name': rule.name,
@@ -96,7 +132,7 @@ class AuditPolicy:
             } for rule in self.rules
         ]
 
-        return {
+        result = {
             'name': self.name,
             'description': self.description,
             'version': self.version,
@@ -109,6 +145,18 @@ class AuditPolicy:
             'metadata': self.metadata,
             'extends': self.extends
         }
+        self._dict_cache = result
+        self._dict_cache_key = cache_key
+        return result
+
+    # Severity -> default_exit_codes key; built once, get_exit_code runs
+    # per violation
+    _SEVERITY_TO_EXIT_KEY = {
+        Severity.INFO: "success",
+        Severity.WARN: "warning",
+        Severity.ERROR: "error",
+        Severity.FATAL: "fatal"
+    }
 
     def get_exit_code(self, violation_severity: Severity, fail_fast: bool = False, custom_exit_code: Optional[int] = None) -> int:
         """
@@ -119,11 +167,5 @@ class AuditPolicy:
         if fail_fast:
             return self.default_exit_codes.get("fail_fast", 2)
 
-        severity_map = {
-            Severity.INFO: "success",
-            Severity.WARN: "warning",
-            Severity.ERROR: "error",
-            Severity.FATAL: "fatal"
-        }
-        key = severity_map.get(violation_severity, "error")
+        key = self._SEVERITY_TO_EXIT_KEY.get(violation_severity, "error")
         return self.default_exit_codes.get(key, 2)
@@ -1,6 +1,14 @@
+import json
 import os
+import tempfile
 from typing import List, Optional
 
+import yaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from rules.audit_policy import AuditPolicy  # Ensure this path is correct
 
 class AuditPolicyManager:
@@ -18,6 +26,8 @@ class AuditPolicyManager:
         """
         self.policy_dirs = policy_dirs or ["./policies", "./audit"]
         self._policy_cache = {}  # Cache for loaded policies
+        # Per-directory listing cache: {directory: (st_mtime_ns, names)}
+        self._listing_cache = {}
 
     def get_policy(self, policy_name_or_path: str,
                    environment: Optional[str] = None,
@@ -35,7 +45,7 @@ class AuditPolicyManager:
         """
         # If it's a direct file path
         if os.path.isfile(policy_name_or_path):
-            policy = AuditPolicy.from_file(policy_name_or_path)
+            policy = self._load_policy_file(policy_name_or_path)
         else:
             policy = self._find_policy_by_name(policy_name_or_path)
 
@@ -67,12 +77,59 @@ class AuditPolicyManager:
             for ext in ['.yaml', '.yml', '.json']:
                 path = os.path.join(directory, f"{policy_name}{ext}")
                 if os.path.isfile(path):
-                    policy = AuditPolicy.from_file(path)
+                    policy = self._load_policy_file(path)
                     self._policy_cache[policy_name] = policy
                     return policy
 
         raise ValueError(f"Policy not found in configured paths: {policy_name}")
 
+    @staticmethod
+    def _load_policy_file(path: str) -> AuditPolicy:
+        """
+        Load a policy file, caching parsed YAML as a JSON sidecar.
+
+        YAML parsing dominates repeat cold starts, so the parsed dict is
+        written next to the source as <path>.cache.json (atomically, via
+        tempfile+rename) and reloaded with json.load while its mtime is at
+        least the source's. JSON policies load directly.
+        """
+        if path.endswith('.json'):
+            with open(path, "r") as f:
+                return AuditPolicy.from_dict(json.load(f))
+
+        cache_path = path + ".cache.json"
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                with open(cache_path, "r") as f:
+                    return AuditPolicy.from_dict(json.load(f))
+        except (OSError, ValueError):
+            pass  # missing or unreadable sidecar: fall through to YAML
+
+        with open(path, "r") as f:
+            config = yaml.load(f, Loader=_SafeLoader)
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path) or ".", suffix=".cache.json")
+            with os.fdopen(fd, "w") as f:
+                json.dump(config, f)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except (OSError, TypeError, ValueError):
+            # Read-only policy dir, or YAML values JSON can't represent
+            # (dates, etc.) — the sidecar is best-effort, skip it rather
+            # than coerce values and reload them with different types
+            pass
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        return AuditPolicy.from_dict(config)
+
     def list_policies(self) -> List[str]:
         """
         List all available policies from configured directories.
@@ -85,9 +142,24 @@ class AuditPolicyManager:
             if not os.path.isdir(directory):
                 continue
 
-            for filename in os.listdir(directory):
-                if filename.endswith(('.yaml', '.yml', '.json')):
-                    policy_name = os.path.splitext(filename)[0]
-                    policies.add(policy_name)
+            # Unchanged directories (same mtime) reuse the cached listing
+            st_mtime_ns = os.stat(directory).st_mtime_ns
+            cached = self._listing_cache.get(directory)
+            if cached is not None and cached[0] == st_mtime_ns:
+                policies |= cached[1]
+                continue
+
+            # scandir's DirEntry carries type info from the directory read,
+            # so is_file() needs no extra stat per entry
+            names = set()
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith('.cache.json'):
+                        continue  # JSON sidecars written by _load_policy_file
+                    if name.endswith(('.yaml', '.yml', '.json')) and entry.is_file():
+                        names.add(name.rsplit('.', 1)[0])
+            self._listing_cache[directory] = (st_mtime_ns, names)
+            policies |= names
 
         return sorted(policies)
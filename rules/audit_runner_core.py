@@ -6,6 +6,9 @@ from rules.audit_policy_manager import AuditPolicyManager
 from rules.dataset_validator import DatasetValidator
 from visualization.report_renderer_extended import ReportRenderer
 
+# Severities that fail an enforced audit
+_FAIL_SEVERITIES = frozenset({Severity.ERROR.value, Severity.FATAL.value})
+
 class AuditRunner:
     """
     Runs data quality audits using AuditPolicy configurations.
@@ -57,20 +60,25 @@ class AuditRunner:
         # Determine if audit is in dry-run mode
         results['dry_run'] = resolved_policy.default_enforcement != EnforcementMode.ENFORCE
 
-        # Mark violations as dry-run if needed
-        for violation in results.get('violations', []):
-            rule_name = violation.get('rule')
-            rule = next((r for r in resolved_policy.rules if r.name == rule_name), None)
-            if rule and rule.enforcement != EnforcementMode.ENFORCE:
-                violation['enforced'] = False
-                violation['dry_run'] = True
+        # Mark violations as dry-run if needed; with the usual all-ENFORCE
+        # policy there is nothing to mark and the loop is skipped outright
+        non_enforce_rules = {r.name for r in resolved_policy.rules
+                             if r.enforcement != EnforcementMode.ENFORCE}
+        if non_enforce_rules:
+            for violation in results.get('violations', []):
+                if violation.rule in non_enforce_rules:
+                    violation.enforced = False
+                    violation.dry_run = True
 
         # Write output if requested
         if output_file:
             renderer = ReportRenderer(output_format)
             report = renderer.render_report(results)
-            with open(output_file, "w") as f:
-                f.write(report)
+            # Single buffered binary write; renderers that already produce
+            # bytes skip the encode
+            data = report if isinstance(report, bytes) else report.encode("utf-8")
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                f.write(data)
 
         return results
 
@@ -89,15 +97,13 @@ class AuditRunner:
         if policy.default_enforcement != EnforcementMode.ENFORCE:
             return False
 
+        rule_by_name = {r.name: r for r in policy.rules}
         for violation in results.get("violations", []):
-            rule_name = violation.get("rule")
-            severity = violation.get("severity")
-
-            rule = next((r for r in policy.rules if r.name == rule_name), None)
-            if rule and rule.enforcement != EnforcementMode.ENFORCE:
+            if violation.severity not in _FAIL_SEVERITIES:
                 continue
 
-            if severity in (Severity.ERROR.value, Severity.FATAL.value):
+            rule = rule_by_name.get(violation.rule)
+            if rule is None or rule.enforcement == EnforcementMode.ENFORCE:
                 return True
 
         return False
@@ -4,50 +4,102 @@ class MetricsRegistry:
     """Central registry for metrics with optimized computation and caching."""
     
     def __init__(self):
+        # {(dataset_id, column): {metric_name: {params_key: value}}} —
+        # dependency checks are dict hits within one column's bucket rather
+        # than scans of the whole cache
         self.computed_metrics = {}
         self.computation_graph = self._build_dependency_graph()
-        
+
+    # Cached column buckets; oldest-touched buckets are evicted past this
+    _MAX_BUCKETS = 4096
+
     def get_metric(self, dataset, column, metric_name, params=None):
         """Get a metric, computing it if necessary and caching the result."""
-        key = self._create_cache_key(dataset, column, metric_name, params)
-        
-        if key in self.computed_metrics:
-            return self.computed_metrics[key]
-        
-        if self._can_derive_from_cache(key, metric_name):
-            value = self._derive_from_cache(key, metric_name)
-            self.computed_metrics[key] = value
-            return value
-        
-        value = self._compute_metric(dataset, column, metric_name, params)
-        self.computed_metrics[key] = value
+        # Columns the dataset doesn't have bypass the cache entirely —
+        # don't let a bad signature evict or pollute real entries
+        columns = getattr(dataset, "columns", None)
+        if columns is not None and column not in columns:
+            return self._compute_metric(dataset, column, metric_name, params)
+
+        key = (dataset.id, column)
+        bucket = self.computed_metrics.get(key)
+        if bucket is None:
+            if len(self.computed_metrics) >= self._MAX_BUCKETS:
+                self.computed_metrics.pop(next(iter(self.computed_metrics)))
+            bucket = self.computed_metrics[key] = {}
+        else:
+            # Re-insert so hot datasets sit at the recently-used end
+            del self.computed_metrics[key]
+            self.computed_metrics[key] = bucket
+        params_key = self._params_key(params)
+
+        by_params = bucket.get(metric_name)
+        if by_params is not None and params_key in by_params:
+            return by_params[params_key]
+
+        if self._can_derive_from_cache(bucket, metric_name):
+            value = self._derive_from_cache(bucket, metric_name)
+        else:
+            value = self._compute_with_primitives(bucket, dataset, column,
+                                                  metric_name, params)
+        bucket.setdefault(metric_name, {})[params_key] = value
         return value
-    
-    def _create_cache_key(self, dataset, column, metric_name, params):
-        param_str = json.dumps(params, sort_keys=True) if params else ""
-        return f"{dataset.id}:{column}:{metric_name}:{param_str}"
-    
-    def _can_derive_from_cache(self, key, metric_name):
+
+    # Primitives co-computed in one column pass; every derived metric in
+    # the computation graph is arithmetic over these
+    _PRIMITIVE_METRICS = frozenset({"sum", "sum_squared", "count", "null_count"})
+
+    def _compute_with_primitives(self, bucket, dataset, column, metric_name, params):
+        """On a miss, compute all primitives in one pass over the column,
+        warm the bucket with them, and answer derived metrics by
+        arithmetic — one scan instead of one per dependency."""
+        if (metric_name in self._PRIMITIVE_METRICS
+                or metric_name in self.computation_graph):
+            try:
+                primitives = self._compute_primitives(dataset, column)
+            except (TypeError, KeyError, AttributeError):
+                primitives = None  # dataset doesn't expose the column; fall back
+            if primitives is not None:
+                for name, val in primitives.items():
+                    bucket.setdefault(name, {}).setdefault(None, val)
+                if metric_name in self._PRIMITIVE_METRICS:
+                    return primitives[metric_name]
+                return self._derive_from_cache(bucket, metric_name)
+        return self._compute_metric(dataset, column, metric_name, params)
+
+    def _compute_primitives(self, dataset, column):
+        series = dataset[column]
+        valid = series.dropna()
+        arr = valid.to_numpy()
+        return {
+            "sum": float(arr.sum()),
+            "sum_squared": float((arr * arr).sum()),
+            "count": int(arr.size),
+            "null_count": int(len(series) - arr.size),
+        }
+
+    def _params_key(self, params):
+        # Tuple keys hash at C level; no JSON round-trip per lookup. Params
+        # with unhashable values (nested dicts) fall back to a JSON string
+        if not params:
+            return None
+        params_key = tuple(sorted(params.items()))
+        try:
+            hash(params_key)
+        except TypeError:
+            params_key = json.dumps(params, sort_keys=True)
+        return params_key
+
+    def _can_derive_from_cache(self, bucket, metric_name):
         dependencies = self.computation_graph.get(metric_name, [])
         if not dependencies:
             return False
+        return all(dep_metric in bucket for dep_metric in dependencies)
 
-        parts = key.split(":")
-        dataset_id, column = parts[0], parts[1]
-
-        for dep_metric in dependencies:
-            dep_key_prefix = f"{dataset_id}:{column}:{dep_metric}:"
-            if not any(k.startswith(dep_key_prefix) for k in self.computed_metrics):
-                return False
-        return True
-    
-    def _derive_from_cache(self, key, metric_name):
-        parts = key.split(":")
-        dataset_id, column = parts[0], parts[1]
-
+    def _derive_from_cache(self, bucket, metric_name):
         def get_cached_value(metric):
-            key_prefix = f"{dataset_id}:{column}:{metric}:"
-            return next((v for k, v in self.computed_metrics.items() if k.startswith(key_prefix)), None)
+            by_params = bucket.get(metric)
+            return next(iter(by_params.values())) if by_params else None
 
         if metric_name == "mean":
             sum_val = get_cached_value("sum")
@@ -55,9 +107,14 @@ class MetricsRegistry:
             return sum_val / count_val if sum_val is not None and count_val else None
         
         elif metric_name == "null_percent":
+            # count is the non-null count (pandas convention), so total
+            # rows is null_count + count
             null_count = get_cached_value("null_count")
             count = get_cached_value("count")
-            return (null_count / count * 100) if null_count is not None and count else None
+            if null_count is None or count is None:
+                return None
+            total = null_count + count
+            return (null_count / total * 100) if total else None
         
         elif metric_name == "variance":
             sum_squared = get_cached_value("sum_squared")
@@ -1,8 +1,47 @@
-from typing import Dict, Any
+import ast
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional, Set
 import pandas as pd
 
+try:
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
 from rules.audit_policy import AuditPolicy
 
+
+@dataclass(slots=True)
+class Violation:
+    """One rule violation; converted to a dict only at the report boundary."""
+    rule: str
+    severity: str
+    message: str
+    enforced: bool = True
+    dry_run: bool = False
+
+    def get(self, key, default=None):
+        """Dict-style read access for callers written against the old
+        violation dicts."""
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rule": self.rule,
+            "severity": self.severity,
+            "message": self.message,
+            "enforced": self.enforced,
+            "dry_run": self.dry_run,
+        }
+
+
 class DatasetValidator:
     """
     Validates a dataset against rules defined in an AuditPolicy.
@@ -10,11 +49,73 @@ class DatasetValidator:
 
     def __init__(self, policy: AuditPolicy):
         self.policy = policy
+        # condition string -> names it references, parsed once per condition
+        self._condition_names: Dict[str, FrozenSet[str]] = {}
+
+    def _referenced_names(self, rule) -> FrozenSet[str]:
+        """Identifiers a rule's condition mentions.
+
+        Conditions compiled at policy-load time expose their names via
+        code.co_names for free; the AST walk is the fallback for rules
+        built without compile_condition.
+        """
+        code = getattr(rule, "code", None)
+        if code is not None:
+            return frozenset(code.co_names)
+        condition = rule.condition
+        cached = self._condition_names.get(condition)
+        if cached is not None:
+            return cached
+        try:
+            tree = ast.parse(condition, mode="eval")
+            names = frozenset(node.id for node in ast.walk(tree)
+                              if isinstance(node, ast.Name))
+        except SyntaxError:
+            names = frozenset()
+        self._condition_names[condition] = names
+        return names
+
+    def _needed_columns(self, dataset_path: str) -> Optional[List[str]]:
+        """Columns the policy's rules can reference, or None when any
+        condition is unparsable and the whole file must be read."""
+        needed: Set[str] = set()
+        for rule in self.policy.rules:
+            names = self._referenced_names(rule)
+            if not names:
+                return None
+            needed |= names
+        # Conditions also mention function names; keep only real columns
+        header = pd.read_csv(dataset_path, nrows=0).columns
+        include = [col for col in header if col in needed]
+        return include or None
+
+    def _read_dataset(self, dataset_path: str) -> pd.DataFrame:
+        """Load the CSV, multi-threaded via Arrow when it is available,
+        parsing only the columns the rules reference."""
+        include = self._needed_columns(dataset_path)
+        if pacsv is None:
+            return pd.read_csv(dataset_path, usecols=include)
+        convert_options = (pacsv.ConvertOptions(include_columns=include)
+                           if include else None)
+        table = pacsv.read_csv(
+            dataset_path,
+            read_options=pacsv.ReadOptions(use_threads=True,
+                                           block_size=8 << 20),
+            convert_options=convert_options)
+        return table.to_pandas(self_destruct=True)
 
     def validate(self, dataset_path: str) -> Dict[str, Any]:
         """
         Run rule validation on the dataset.
 
+        Rules whose condition references a single column are grouped by
+        that column and evaluated against the shared Series during one
+        scan, so each column's data is pulled through the cache once
+        instead of once per rule. Multi-column (and unparsable) rules
+        keep the whole-frame path. On large datasets the per-column
+        batches run on a thread pool — they touch disjoint Series and
+        pandas releases the GIL inside its reductions.
+
         Args:
             dataset_path: Path to input dataset (CSV)
 
@@ -22,7 +123,7 @@ class DatasetValidator:
             Dict with results including violations
         """
         try:
-            df = pd.read_csv(dataset_path)
+            df = self._read_dataset(dataset_path)
         except Exception as e:
             return {
                 "success": False,
@@ -30,15 +131,42 @@ class DatasetValidator:
                 "violations": []
             }
 
-        violations = []
+        columns: Set[str] = set(df.columns)
+        by_column: Dict[str, list] = {}
+        whole_frame = []
         for rule in self.policy.rules:
-            result = rule.evaluate(df)
+            cols = self._referenced_names(rule) & columns
+            if len(cols) == 1 and hasattr(rule, "evaluate_on_series"):
+                by_column.setdefault(next(iter(cols)), []).append(rule)
+            else:
+                whole_frame.append(rule)
+
+        def eval_column(item):
+            col, rules = item
+            series = df[col]
+            return [(rule, rule.evaluate_on_series(series)) for rule in rules]
+
+        # Small frames don't repay the pool's startup cost
+        if len(by_column) > 1 and len(df) > 10_000:
+            max_workers = min(8, len(by_column))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batches = list(executor.map(eval_column, by_column.items()))
+        else:
+            batches = [eval_column(item) for item in by_column.items()]
+
+        violations = []
+
+        def record(rule, result):
             if not result.passed:
-                violations.append({
-                    "rule": rule.name,
-                    "severity": rule.severity.value,
-                    "message": result.message
-                })
+                violations.append(Violation(rule.name, rule.severity.value,
+                                            result.message))
+
+        for batch in batches:
+            for rule, result in batch:
+                record(rule, result)
+
+        for rule in whole_frame:
+            record(rule, rule.evaluate(df))
 
         return {
             "success": True,
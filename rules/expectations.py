@@ -1,12 +1,16 @@
 from typing import Optional, List
 
 class ValidationResult:
+    __slots__ = ("is_valid", "expectation", "message")
+
     def __init__(self, is_valid: Optional[bool], expectation=None, message: str = ""):
         self.is_valid = is_valid
         self.expectation = expectation
         self.message = message
 
 class ValidationReport:
+    __slots__ = ("results",)
+
     def __init__(self, results: List[ValidationResult]):
         self.results = results
 
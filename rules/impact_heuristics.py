@@ -1,24 +1,52 @@
+import functools
+
+_USAGE_SCORES = {
+    "age": 8,
+    "income": 6,
+    "zipcode": 3,
+    "gender": 5,
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_column_usage_score(column_name):
     """
     Stub for downstream usage scoring logic.
     This should return a numeric score representing how heavily a column is used
     in downstream transformations, reports, or ML pipelines.
 
-    For now, it returns a mocked score. Replace with actual logic or lookup.
+    For now, it returns a mocked score. Replace with actual logic or lookup;
+    the lru_cache keeps repeated per-violation calls a dict hit either way.
     """
-    usage_scores = {
-        "age": 8,
-        "income": 6,
-        "zipcode": 3,
-        "gender": 5,
-    }
-    return usage_scores.get(column_name, 2)
+    return _USAGE_SCORES.get(column_name, 2)
+
+
+def build_dependency_index(rules):
+    """
+    Build a column -> [rule] reverse index, calling each rule's
+    get_dependencies() exactly once. Build this once per audit run and
+    pass it to assess_impact so violations don't re-scan the rule list.
+    """
+    index = {}
+    for rule in rules:
+        if not hasattr(rule, "get_dependencies"):
+            continue
+        for column in rule.get_dependencies():
+            index.setdefault(column, []).append(rule)
+    return index
 
 
-def assess_impact(violation, profiles, rules):
+def assess_impact(violation, profiles, rules, rules_index=None,
+                  correlation_cache=None):
     """
     Assess the impact of a violation based on profiles and rule dependencies.
 
+    Args:
+        rules_index: Optional column -> [rule] index from
+            build_dependency_index; built from `rules` on the fly if absent
+        correlation_cache: Optional per-run dict memoizing each column's
+            target correlation across violations
+
     Returns:
         dict with:
             - dependent_rule_count
@@ -36,16 +64,20 @@ def assess_impact(violation, profiles, rules):
         }
 
     # Rules where this column is a dependency
-    dependent_rules = [
-        r for r in rules
-        if hasattr(r, "get_dependencies") and column in r.get_dependencies()
-    ]
+    if rules_index is None:
+        rules_index = build_dependency_index(rules)
+    dependent_rules = rules_index.get(column, ())
 
-    # Safe correlation lookup
-    try:
-        target_correlation = profiles.current.get_correlation(column, 'target_variable') or 0.0
-    except AttributeError:
-        target_correlation = 0.0
+    # Safe correlation lookup, memoized across the run's violations
+    if correlation_cache is not None and column in correlation_cache:
+        target_correlation = correlation_cache[column]
+    else:
+        try:
+            target_correlation = profiles.current.get_correlation(column, 'target_variable') or 0.0
+        except AttributeError:
+            target_correlation = 0.0
+        if correlation_cache is not None:
+            correlation_cache[column] = target_correlation
 
     # Usage score estimation
     try:
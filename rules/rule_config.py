@@ -1,10 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import CodeType
 from typing import Optional, Dict, Any
 
 from rules.severity_levels import Severity
 from rules.enforcement_mode import EnforcementMode
 
-@dataclass
+@dataclass(slots=True)
 class RuleConfig:
     name: str
     condition: str
@@ -14,3 +15,21 @@ class RuleConfig:
     fail_fast: bool = False
     exit_code: Optional[int] = None
     metadata: Dict[str, Any] = None
+    # Condition compiled once (see compile_condition); None when the
+    # condition isn't a Python expression and must be parsed by the evaluator
+    code: Optional[CodeType] = field(default=None, repr=False, compare=False)
+
+    def compile_condition(self) -> Optional[CodeType]:
+        """Compile the condition to a reusable code object.
+
+        Evaluators can eval(rule.code, ...) per dataset instead of
+        re-parsing the string, and rule.code.co_names exposes the
+        identifiers the condition references without an AST walk.
+        """
+        if self.code is None:
+            try:
+                self.code = compile(self.condition, f"<rule:{self.name}>",
+                                    "eval")
+            except SyntaxError:
+                return None
+        return self.code
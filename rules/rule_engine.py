@@ -1,5 +1,10 @@
 
 import yaml
+try:
+    # libyaml-backed loader: C tokenizer, same safe-construction semantics
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 from rules.rule_evaluator import RuleEvaluator
 
 def validate_dataset_against_rules(profile, rule_file_path):
@@ -14,7 +19,7 @@ def validate_dataset_against_rules(profile, rule_file_path):
         (bool, list): (True, []) if all pass; else (False, list of violations)
     """
     with open(rule_file_path, "r") as f:
-        rule_defs = yaml.safe_load(f)
+        rule_defs = yaml.load(f, Loader=_SafeLoader)
 
     evaluator = RuleEvaluator()
     summary = profile.get_summary()
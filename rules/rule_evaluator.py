@@ -1,13 +1,14 @@
 class StatisticsCache:
     def __init__(self):
-        # Structure: {dataset_id: {column_name: {stat_name: value}}}
+        # Flat {(dataset_id, column_name, stat_name): value} — one hash per
+        # lookup instead of three nested dict traversals
         self.stats = {}
 
     def get(self, dataset_id, column, stat_name, default=None):
-        return self.stats.get(dataset_id, {}).get(column, {}).get(stat_name, default)
+        return self.stats.get((dataset_id, column, stat_name), default)
 
     def set(self, dataset_id, column, stat_name, value):
-        self.stats.setdefault(dataset_id, {}).setdefault(column, {})[stat_name] = value
+        self.stats[(dataset_id, column, stat_name)] = value
 
 
 # === Rule Functions That Use the Cache ===
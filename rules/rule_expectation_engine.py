@@ -1,6 +1,11 @@
 # rule_expectation_engine.py
 
 import yaml
+try:
+    # libyaml-backed loader: C tokenizer, same safe-construction semantics
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 from rules.expectations import (
     NullPercentageExpectation,  # ensure these classes are implemented or stubbed
     ComparativeExpectation,
@@ -12,7 +17,7 @@ class ExpectationLoader:
     def load_from_yaml(self, yaml_path):
         """Load expectations from a YAML file."""
         with open(yaml_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_SafeLoader)
 
         self._validate_config_schema(config)
 
@@ -1,3 +1,5 @@
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
 from typing import List
 
 # -------- STUBS for Dependencies (Replace with real imports in production) -------- #
@@ -26,7 +28,41 @@ class SmartSampler:
 
 class ParallelValidator:
     def validate_parallel(self, expectations, dataset, max_workers=4):
-        return [e.validate(dataset) for e in expectations]  # Simple simulated parallelism
+        """Run expectation validation concurrently, preserving input order.
+
+        Validation is mostly metric-lookup and sampling work that waits
+        on I/O or releases the GIL, so threads are the default.
+        Expectations flagged run_in_separate_process are CPU-bound and
+        go through a process pool instead.
+        """
+        if len(expectations) <= 1:
+            return [exp.validate(dataset) for exp in expectations]
+
+        results = [None] * len(expectations)
+        in_process = [
+            (i, exp) for i, exp in enumerate(expectations)
+            if getattr(exp, "run_in_separate_process", False)
+        ]
+        in_thread = [
+            (i, exp) for i, exp in enumerate(expectations)
+            if not getattr(exp, "run_in_separate_process", False)
+        ]
+
+        if in_thread:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(exp.validate, dataset): i
+                           for i, exp in in_thread}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+        if in_process:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(exp.validate, dataset): i
+                           for i, exp in in_process}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+        return results
 
 class WideDatasetProcessor:
     def process_wide_dataset(self, dataset, expectations):
@@ -70,6 +106,10 @@ class OptimizedValidationEngine:
         else:
             raise ValueError(f"Unsupported processing mode: {mode}")
 
+    # Sequential in-memory validation switches to a pool past this many
+    # expectations, even when the plan didn't ask for parallelism
+    _PARALLEL_THRESHOLD = 8
+
     def _validate_in_memory(self, expectations: List, dataset, plan: dict) -> List:
         """Validate expectations using in-memory strategy."""
         if plan.get("parallelization", {}).get("enabled", False):
@@ -77,13 +117,15 @@ class OptimizedValidationEngine:
                 expectations, dataset,
                 max_workers=plan["parallelization"].get("workers", 4)
             )
-        else:
-            results = []
-            for exp in expectations:
-                sampled_data = self.sampler.sample_for_validation(dataset, exp)
-                result = exp.validate(sampled_data, metrics_registry=self.metrics_registry)
-                results.append(result)
-            return results
+
+        def validate_one(exp):
+            sampled_data = self.sampler.sample_for_validation(dataset, exp)
+            return exp.validate(sampled_data, metrics_registry=self.metrics_registry)
+
+        if len(expectations) > self._PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                return list(executor.map(validate_one, expectations))
+        return [validate_one(exp) for exp in expectations]
 
     def _validate_streaming(self, expectations: List, dataset, plan: dict) -> List:
         """Stub for streaming validation strategy — extend as needed."""
@@ -1,22 +1,92 @@
-import re
+import string
 
 class RuleParser:
+    # Character classes precomputed as frozensets: membership is one hash,
+    # the scan is a single left-to-right pass with no backtracking
+    _WS = frozenset(" \t\r\n")
+    _DIGITS = frozenset(string.digits)
+    _WORD = frozenset(string.ascii_letters + string.digits + "_")
+    _ARG = _WORD | {"."}
+    _CMP_START = frozenset("<>=!")
+    _TWO_CHAR_OPS = frozenset({"==", "!=", "<=", ">="})
+    _QUOTES = frozenset("\"'")
+    _LOGICAL = frozenset({"AND", "OR", "NOT"})
+
     def parse(self, rule_string):
-        tokens = self.tokenize(rule_string)
-        normalized_tokens = [t for group in tokens for t in group if t]
-        return self.build_ast(normalized_tokens)
+        tokens = list(self._scan(rule_string))
+        return self.build_ast(tokens)
 
     def tokenize(self, rule_string):
-        token_pattern = r"""
-            (\w+\([\w\.]+\))       |  # Function calls
-            (==|!=|<=|>=|<|>)      |  # Comparison ops
-            (\d+\.\d+|\d+)         |  # Numbers
-            (["'][^"']+["'])       |  # Strings
-            (\()|(\))              |  # Parentheses
-            (\bAND\b|\bOR\b|\bNOT\b) # Logical ops
+        """Token texts in order, for callers that don't need the kinds."""
+        return [value for _, value in self._scan(rule_string)]
+
+    def _scan(self, rule_string):
+        """Yield (kind, value) pairs in one pass over the rule string.
+
+        Kinds: FUNC, OP, NUMBER, STRING, LPAREN, RPAREN, LOGICAL.
+        Anything unrecognized (bare words, stray punctuation) is skipped,
+        matching the old regex tokenizer's behavior.
         """
-        matches = re.findall(token_pattern, rule_string, re.IGNORECASE | re.VERBOSE)
-        return matches
+        s = rule_string
+        i, n = 0, len(s)
+        while i < n:
+            ch = s[i]
+            if ch in self._WS:
+                i += 1
+            elif ch == "(":
+                yield ("LPAREN", "(")
+                i += 1
+            elif ch == ")":
+                yield ("RPAREN", ")")
+                i += 1
+            elif ch in self._CMP_START:
+                two = s[i:i + 2]
+                if two in self._TWO_CHAR_OPS:
+                    yield ("OP", two)
+                    i += 2
+                elif ch in "<>":
+                    yield ("OP", ch)
+                    i += 1
+                else:
+                    i += 1  # lone '=' or '!' is not a token
+            elif ch in self._DIGITS:
+                j = i + 1
+                while j < n and s[j] in self._DIGITS:
+                    j += 1
+                if (j + 1 < n and s[j] == "."
+                        and s[j + 1] in self._DIGITS):
+                    j += 2
+                    while j < n and s[j] in self._DIGITS:
+                        j += 1
+                yield ("NUMBER", s[i:j])
+                i = j
+            elif ch in self._QUOTES:
+                j = i + 1
+                while j < n and s[j] not in self._QUOTES:
+                    j += 1
+                if j < n and j > i + 1:
+                    yield ("STRING", s[i:j + 1])
+                    i = j + 1
+                else:
+                    i += 1  # unterminated or empty string literal
+            elif ch in self._WORD:
+                j = i + 1
+                while j < n and s[j] in self._WORD:
+                    j += 1
+                word = s[i:j]
+                if j < n and s[j] == "(":
+                    k = j + 1
+                    while k < n and s[k] in self._ARG:
+                        k += 1
+                    if k > j + 1 and k < n and s[k] == ")":
+                        yield ("FUNC", s[i:k + 1])
+                        i = k + 1
+                        continue
+                if word.upper() in self._LOGICAL:
+                    yield ("LOGICAL", word)
+                i = j
+            else:
+                i += 1
 
     def build_ast(self, tokens):
         raise NotImplementedError("AST builder not yet implemented.")
@@ -1,19 +1,45 @@
+import copy
+import functools
+import os
+
 import yaml
 
-class ExpectationLoader:
-    def load_from_yaml(self, yaml_path):
-        """Load expectations from a YAML file."""
-        with open(yaml_path, "r") as f:
-            config = yaml.safe_load(f)
+# C-accelerated loader when PyYAML was built against libyaml, resolved once
+# at import; same safe-construction semantics either way
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=128)
+def _load_expectations_cached(loader, abs_path, mtime_ns, size):
+    """Parse and build expectations once per (path, mtime, size).
 
-        self._validate_config_schema(config)
+    mtime_ns/size are part of the key purely for invalidation: editing
+    the file changes them and the stale entry is simply never hit again.
+    """
+    with open(abs_path, "r") as f:
+        config = yaml.load(f, Loader=_SafeLoader)
 
-        expectations = []
-        for exp_config in config.get("expectations", []):
-            exp = self._create_expectation(exp_config)
-            expectations.append(exp)
+    loader._validate_config_schema(config)
+    return tuple(loader._create_expectation(exp_config)
+                 for exp_config in config.get("expectations", []))
+
+
+class ExpectationLoader:
+    def load_from_yaml(self, yaml_path):
+        """Load expectations from a YAML file.
 
-        return expectations
+        Parses are cached by (path, mtime, size), so repeated loads of
+        an unchanged file skip the YAML parse; callers get a deep copy
+        and can mutate the result freely.
+        """
+        abs_path = os.path.abspath(yaml_path)
+        st = os.stat(abs_path)
+        cached = _load_expectations_cached(self, abs_path,
+                                           st.st_mtime_ns, st.st_size)
+        return copy.deepcopy(list(cached))
 
     def _validate_config_schema(self, config):
         if "expectations" not in config or not isinstance(config["expectations"], list):
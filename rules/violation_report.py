@@ -1,3 +1,14 @@
+import sys
+from bisect import bisect_left
+
+# Interned once so the severity labels annotated onto millions of
+# violations share storage and compare by identity
+_LOW = sys.intern("LOW")
+_MEDIUM = sys.intern("MEDIUM")
+_HIGH = sys.intern("HIGH")
+_LEVELS = (_LOW, _MEDIUM, _HIGH)
+
+
 # Extend existing violation objects
 class RuleViolation:
     def __init__(self, rule_id, details, violation_type):
@@ -42,33 +53,21 @@ class ExplanationService:
         violation.fix_suggestion = self._suggest_fix(violation)
         return violation
 
+    # Per violation type: the detail key to grade on and its ascending
+    # severity thresholds (strictly-greater semantics via bisect_left)
+    _SEVERITY_RULES = {
+        "missing_values": ("missing_rate", (0.2, 0.5)),
+        "drift": ("drift_score", (0.4, 0.7)),
+        "outliers": ("outlier_count", (10, 50)),
+    }
+
     def _determine_severity(self, violation):
-        # Simplified severity logic based on violation type and detail thresholds
-        if violation.violation_type == "missing_values":
-            rate = violation.details.get("missing_rate", 0)
-            if rate > 0.5:
-                return "HIGH"
-            elif rate > 0.2:
-                return "MEDIUM"
-            else:
-                return "LOW"
-        elif violation.violation_type == "drift":
-            score = violation.details.get("drift_score", 0)
-            if score > 0.7:
-                return "HIGH"
-            elif score > 0.4:
-                return "MEDIUM"
-            else:
-                return "LOW"
-        elif violation.violation_type == "outliers":
-            count = violation.details.get("outlier_count", 0)
-            if count > 50:
-                return "HIGH"
-            elif count > 10:
-                return "MEDIUM"
-            else:
-                return "LOW"
-        return "MEDIUM"
+        rule = self._SEVERITY_RULES.get(violation.violation_type)
+        if rule is None:
+            return _MEDIUM
+        detail_key, thresholds = rule
+        value = violation.details.get(detail_key, 0)
+        return _LEVELS[bisect_left(thresholds, value)]
 
     def _generate_explanation(self, violation):
         return self.templates.get_explanation(violation.violation_type, violation.details)
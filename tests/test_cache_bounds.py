@@ -0,0 +1,68 @@
+import pandas as pd
+
+from profiler.column_type_inferer import ColumnTypeInferer
+from rules.conditional_rule_validator import MetricsRegistry
+
+
+class _Dataset:
+    """Minimal dataset stand-in with the id/columns/getitem surface
+    MetricsRegistry expects."""
+
+    def __init__(self, dataset_id, df):
+        self.id = dataset_id
+        self._df = df
+
+    @property
+    def columns(self):
+        return self._df.columns
+
+    def __getitem__(self, column):
+        return self._df[column]
+
+
+def test_inference_cache_is_bounded():
+    inferer = ColumnTypeInferer()
+    inferer._CACHE_MAX = 4
+    for i in range(10):
+        inferer.infer_column_type(pd.Series([i, i + 1, i + 2]))
+    assert len(inferer._cache) <= 4
+
+
+def test_inference_cache_hits_on_same_series():
+    inferer = ColumnTypeInferer()
+    series = pd.Series([1, 2, 3])
+    assert inferer.infer_column_type(series) is inferer.infer_column_type(series)
+
+
+def test_metric_registry_derives_from_one_pass():
+    registry = MetricsRegistry()
+    dataset = _Dataset("d1", pd.DataFrame({"a": [1.0, 2.0, 3.0, None]}))
+    assert registry.get_metric(dataset, "a", "sum") == 6.0
+    assert registry.get_metric(dataset, "a", "mean") == 2.0
+    assert registry.get_metric(dataset, "a", "null_percent") == 25.0
+
+
+def test_metric_registry_evicts_least_recently_used():
+    registry = MetricsRegistry()
+    registry._MAX_BUCKETS = 3
+    datasets = {name: _Dataset(name, pd.DataFrame({"a": [1.0, 2.0]}))
+                for name in ("p", "q", "r", "s")}
+    registry.get_metric(datasets["p"], "a", "sum")
+    registry.get_metric(datasets["q"], "a", "sum")
+    registry.get_metric(datasets["r"], "a", "sum")
+    registry.get_metric(datasets["p"], "a", "sum")  # touch p: most recent
+    registry.get_metric(datasets["s"], "a", "sum")  # evicts q, the oldest
+
+    assert ("p", "a") in registry.computed_metrics
+    assert ("q", "a") not in registry.computed_metrics
+    assert len(registry.computed_metrics) == 3
+
+
+def test_metric_registry_bypasses_cache_for_unknown_columns():
+    registry = MetricsRegistry()
+    dataset = _Dataset("d1", pd.DataFrame({"a": [1.0]}))
+    try:
+        registry.get_metric(dataset, "missing", "sum")
+    except NotImplementedError:
+        pass  # the non-cached fallback is a placeholder
+    assert ("d1", "missing") not in registry.computed_metrics
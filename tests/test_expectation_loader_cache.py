@@ -0,0 +1,46 @@
+from rules import rule_snapshot_comparator
+from rules.rule_snapshot_comparator import ExpectationLoader
+
+EXPECTATIONS_YAML = """expectations:
+  - type: column
+    column: age
+  - type: dataset
+    rule: row_count
+"""
+
+
+def test_repeat_loads_hit_the_cache(tmp_path):
+    path = tmp_path / "exp.yaml"
+    path.write_text(EXPECTATIONS_YAML)
+    loader = ExpectationLoader()
+
+    first = loader.load_from_yaml(str(path))
+    misses = rule_snapshot_comparator._load_expectations_cached.cache_info().misses
+    second = loader.load_from_yaml(str(path))
+
+    assert rule_snapshot_comparator._load_expectations_cached.cache_info().misses == misses
+    assert first == second
+
+
+def test_cached_results_are_isolated_copies(tmp_path):
+    path = tmp_path / "exp.yaml"
+    path.write_text(EXPECTATIONS_YAML)
+    loader = ExpectationLoader()
+
+    first = loader.load_from_yaml(str(path))
+    first[0]["config"]["column"] = "mutated"
+
+    assert loader.load_from_yaml(str(path))[0]["config"]["column"] == "age"
+
+
+def test_cache_invalidated_when_file_changes(tmp_path):
+    path = tmp_path / "exp.yaml"
+    path.write_text(EXPECTATIONS_YAML)
+    loader = ExpectationLoader()
+    assert len(loader.load_from_yaml(str(path))) == 2
+
+    path.write_text("expectations:\n  - type: dataset\n    rule: row_count\n")
+
+    reloaded = loader.load_from_yaml(str(path))
+    assert len(reloaded) == 1
+    assert reloaded[0]["type"] == "dataset"
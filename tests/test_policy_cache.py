@@ -0,0 +1,68 @@
+import json
+import os
+
+from rules.audit_policy_manager import AuditPolicyManager
+
+POLICY_YAML = """name: cached_policy
+rules:
+  - name: r1
+    condition: missing_rate(a) < 0.1
+    severity: error
+"""
+
+
+def test_yaml_load_writes_json_sidecar(tmp_path):
+    path = tmp_path / "p.yaml"
+    path.write_text(POLICY_YAML)
+
+    policy = AuditPolicyManager._load_policy_file(str(path))
+
+    assert policy.name == "cached_policy"
+    assert policy.rules[0].name == "r1"
+    sidecar = str(path) + ".cache.json"
+    assert os.path.exists(sidecar)
+
+
+def test_fresh_sidecar_is_preferred_over_yaml(tmp_path):
+    path = tmp_path / "p.yaml"
+    path.write_text(POLICY_YAML)
+    AuditPolicyManager._load_policy_file(str(path))
+
+    # Rewrite the sidecar under a different name and keep it newer than
+    # the source; the loader should serve it without re-parsing the YAML
+    sidecar = str(path) + ".cache.json"
+    with open(sidecar) as f:
+        config = json.load(f)
+    config["name"] = "from_sidecar"
+    with open(sidecar, "w") as f:
+        json.dump(config, f)
+    src_mtime = os.path.getmtime(str(path))
+    os.utime(sidecar, (src_mtime + 10, src_mtime + 10))
+
+    assert AuditPolicyManager._load_policy_file(str(path)).name == "from_sidecar"
+
+
+def test_stale_sidecar_is_invalidated_by_source_mtime(tmp_path):
+    path = tmp_path / "p.yaml"
+    path.write_text(POLICY_YAML)
+    AuditPolicyManager._load_policy_file(str(path))
+
+    path.write_text(POLICY_YAML.replace("cached_policy", "edited_policy"))
+    sidecar = str(path) + ".cache.json"
+    src_mtime = os.path.getmtime(str(path))
+    os.utime(sidecar, (src_mtime - 10, src_mtime - 10))
+
+    assert AuditPolicyManager._load_policy_file(str(path)).name == "edited_policy"
+
+
+def test_unserializable_yaml_values_skip_sidecar(tmp_path):
+    # An unquoted date parses to datetime.date, which json.dump rejects;
+    # the policy must still load and no sidecar or tempfile may be left
+    path = tmp_path / "dated.yaml"
+    path.write_text("effective_date: 2026-01-01\n" + POLICY_YAML)
+
+    policy = AuditPolicyManager._load_policy_file(str(path))
+
+    assert policy.name == "cached_policy"
+    assert not os.path.exists(str(path) + ".cache.json")
+    assert os.listdir(tmp_path) == ["dated.yaml"]
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profiler.type_coercion_mixin import RobustDatasetProfiler
+
+
+@pytest.fixture
+def numeric_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.normal(10, 2, 2000),
+        "b": rng.integers(0, 100, 2000).astype(float),
+    })
+    df.loc[df.index[:50], "a"] = None
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+def test_streaming_profile_matches_in_memory(numeric_csv):
+    whole = RobustDatasetProfiler().profile_csv(numeric_csv)
+    streamed = RobustDatasetProfiler().profile_csv(numeric_csv, chunksize=500)
+
+    assert streamed["dataset_info"]["row_count"] == whole["dataset_info"]["row_count"]
+    assert set(streamed["column_profiles"]) == set(whole["column_profiles"])
+
+    for col, data in whole["column_profiles"].items():
+        w = data["profile"]
+        s = streamed["column_profiles"][col]["profile"]
+        assert s["count"] == w["count"]
+        assert s["null_count"] == w["null_count"]
+        for stat in ("mean", "min", "max", "std", "median"):
+            if w.get(stat) is None:
+                assert s.get(stat) is None
+            else:
+                assert s[stat] == pytest.approx(w[stat], rel=1e-6), (col, stat)
+
+
+def test_streaming_summary_counts(numeric_csv):
+    profile = RobustDatasetProfiler().profile_csv(numeric_csv, chunksize=500)
+    summary = profile["profiling_summary"]
+    # 50 nulls in one of two 2000-row columns
+    assert summary["missing_cells"] == 50
+    assert summary["completeness"] == pytest.approx(100 * (4000 - 50) / 4000)
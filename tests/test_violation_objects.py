@@ -0,0 +1,35 @@
+import pytest
+
+from rules.dataset_validator import Violation
+
+
+def test_violation_defaults_and_to_dict():
+    v = Violation("r1", "error", "boom")
+    assert v.enforced is True
+    assert v.dry_run is False
+    assert v.to_dict() == {
+        "rule": "r1",
+        "severity": "error",
+        "message": "boom",
+        "enforced": True,
+        "dry_run": False,
+    }
+
+
+def test_violation_dict_style_reads():
+    v = Violation("r1", "error", "boom")
+    # Both access styles the old violation dicts supported
+    assert v["rule"] == "r1"
+    assert v["severity"] == "error"
+    assert v.get("enforced") is True
+    assert v.get("missing_key", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        v["missing_key"]
+
+
+def test_violation_dry_run_marking():
+    v = Violation("r1", "error", "boom")
+    v.enforced = False
+    v.dry_run = True
+    assert v.to_dict()["enforced"] is False
+    assert v.to_dict()["dry_run"] is True
@@ -63,8 +63,13 @@ class ReportRenderer:
         }
 
     def _process_violations(self, results: Dict[str, Any]) -> Any:
-        """Process violation list for rendering."""
-        return results.get("violations", [])
+        """Process violation list for rendering.
+
+        Violation objects are converted to dicts here, once, at the
+        serialization boundary; plain dicts pass through untouched.
+        """
+        return [v.to_dict() if hasattr(v, "to_dict") else v
+                for v in results.get("violations", [])]
 
     def _process_statistics(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Extract any extra statistics (placeholder for now)."""